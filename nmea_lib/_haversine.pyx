@@ -0,0 +1,21 @@
+# cython: language_level=3, cdivision=True
+"""Compiled haversine kernel for Position.distance_to.
+
+Optional extension module: built by setup.py when Cython is available.
+Position falls back to its pure-Python implementation when it is missing.
+"""
+
+from libc.math cimport atan2, cos, fmax, sin, sqrt, M_PI
+
+cdef double DEG_TO_RAD = M_PI / 180.0
+cdef double EARTH_RADIUS_M = 6371000.0
+
+
+cpdef double haversine_m(double lat1, double lon1, double lat2, double lon2) nogil:
+    """Great-circle distance in meters between two decimal-degree positions."""
+    cdef double phi1 = lat1 * DEG_TO_RAD
+    cdef double phi2 = lat2 * DEG_TO_RAD
+    cdef double s_dphi = sin((phi2 - phi1) * 0.5)
+    cdef double s_dlambda = sin((lon2 - lon1) * DEG_TO_RAD * 0.5)
+    cdef double a = s_dphi * s_dphi + cos(phi1) * cos(phi2) * s_dlambda * s_dlambda
+    return 2.0 * EARTH_RADIUS_M * atan2(sqrt(a), sqrt(fmax(1.0 - a, 0.0)))
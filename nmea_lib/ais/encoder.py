@@ -1,29 +1,35 @@
 """6-bit ASCII encoding utilities for AIS messages."""
 
 from typing import List
+
+import numpy as np
+
 from nmea_lib.ais.constants import AIS_6BIT_ASCII, AIS_ASCII_6BIT
 
+# Bit weights of one 6-bit group (MSB first) and the ASCII byte for each value
+_SIXBIT_WEIGHTS = np.array([32, 16, 8, 4, 2, 1], dtype=np.uint8)
+_SIXBIT_TABLE = np.frombuffer("".join(AIS_6BIT_ASCII).encode('ascii'), dtype=np.uint8)
+
 
 class AIS6BitEncoder:
     """Handles 6-bit ASCII encoding and decoding for AIS messages."""
     
     @staticmethod
     def encode_binary_to_6bit(binary_data: str) -> str:
-        """Convert binary string to 6-bit ASCII encoded string."""
-        # Ensure binary data length is multiple of 6
-        while len(binary_data) % 6 != 0:
-            binary_data += "0"
-        
-        encoded = ""
-        for i in range(0, len(binary_data), 6):
-            # Extract 6-bit chunk
-            chunk = binary_data[i:i+6]
-            # Convert to integer
-            value = int(chunk, 2)
-            # Map to 6-bit ASCII character
-            encoded += AIS_6BIT_ASCII[value]
+        """Convert binary string to 6-bit ASCII encoded string.
+
+        The whole bit string is converted with NumPy: the '0'/'1' bytes
+        become a bit array, each row of 6 is weighted into its value and
+        mapped through the 6-bit ASCII table in one indexing step.
+        """
+        # Pad with zero bits to a multiple of 6
+        binary_data += "0" * (-len(binary_data) % 6)
         
-        return encoded
+        bits = np.frombuffer(binary_data.encode('ascii'), dtype=np.uint8) - ord('0')
+        if bits.size and bits.max() > 1:
+            raise ValueError(f"Invalid binary data: {binary_data}")
+        values = bits.reshape(-1, 6) @ _SIXBIT_WEIGHTS
+        return _SIXBIT_TABLE[values].tobytes().decode('ascii')
     
     @staticmethod
     def decode_6bit_to_binary(encoded_data: str) -> str:
@@ -1,10 +1,15 @@
 """Base classes and interfaces for NMEA sentence handling."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Union, Any
+from typing import TYPE_CHECKING, List, Optional, Union, Any
 from dataclasses import dataclass
 from enum import Enum
 
+from .validator import SentenceValidator
+
+if TYPE_CHECKING:
+    from .parser import SentenceParser
+
 
 class TalkerId(Enum):
     """NMEA Talker ID enumeration."""
@@ -99,16 +104,22 @@ class Sentence(ABC):
         """Parse NMEA string to create sentence object."""
         pass
     
+    @classmethod
+    def _from_parser(cls, parser: 'SentenceParser') -> 'Sentence':
+        """Create sentence object from an already parsed NMEA string.
+
+        Subclasses override this to reuse the parser's fields; the default
+        parses the raw sentence again.
+        """
+        return cls.from_sentence(parser.raw_sentence)
+    
     def get_sentence_header(self) -> str:
         """Get the sentence header (e.g., '$GPGGA')."""
         return f"{self.BEGIN_CHAR}{self.talker_id.value}{self.sentence_id.value}"
     
     def calculate_checksum(self, sentence_body: str) -> str:
         """Calculate NMEA checksum for sentence body."""
-        checksum = 0
-        for char in sentence_body:
-            checksum ^= ord(char)
-        return f"{checksum:02X}"
+        return SentenceValidator.calculate_checksum(sentence_body)
 
     def __str__(self) -> str:
         """Return the NMEA sentence string representation."""
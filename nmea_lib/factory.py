@@ -29,7 +29,7 @@ class SentenceFactory:
             if not sentence_class:
                 raise ValueError(f"Unsupported sentence type: {parser.sentence_id}")
             
-            return sentence_class.from_sentence(nmea_string)
+            return sentence_class._from_parser(parser)
             
         except (ValueError, Exception):
             return None
@@ -16,34 +16,29 @@ class SentenceParser:
     
     def _parse(self) -> None:
         """Parse the NMEA sentence into components."""
-        if not SentenceValidator.is_valid(self.raw_sentence):
-            raise ValueError(f"Invalid NMEA sentence: {self.raw_sentence}")
+        raw = self.raw_sentence
+        lexed = SentenceValidator.scan(raw)
+        if lexed is None:
+            raise ValueError(f"Invalid NMEA sentence: {raw}")
+        if raw[0] != '$':
+            raise ValueError(f"Cannot parse sentence components: {raw}")
         
-        # Extract components
-        talker_str = SentenceValidator.extract_talker_id(self.raw_sentence)
-        sentence_str = SentenceValidator.extract_sentence_id(self.raw_sentence)
-        fields = SentenceValidator.extract_fields(self.raw_sentence)
-        
-        if not talker_str or not sentence_str:
-            raise ValueError(f"Cannot parse sentence components: {self.raw_sentence}")
-        
-        # Extract checksum
-        checksum_part = self.raw_sentence.split('*')[1]
-        checksum = checksum_part.rstrip('\r\n')
+        _, _, field_block, checksum, _ = lexed
+        fields = field_block.split(',')
         
         # Create parsed data
         try:
-            talker_id = TalkerId.parse(self.raw_sentence)
-            sentence_id = SentenceId.parse(self.raw_sentence)
+            talker_id = TalkerId.parse(raw)
+            sentence_id = SentenceId.parse(raw)
         except ValueError as e:
-            raise ValueError(f"Unsupported sentence type: {talker_str}{sentence_str}") from e
+            raise ValueError(f"Unsupported sentence type: {raw[1:6]}") from e
         
         self.parsed_data = ParsedSentence(
             talker_id=talker_id,
             sentence_id=sentence_id,
             fields=fields,
             checksum=checksum,
-            raw_sentence=self.raw_sentence
+            raw_sentence=raw
         )
     
     def get_field(self, index: int) -> str:
@@ -38,12 +38,10 @@ class AIVDMSentence:
         sentence_body = ",".join(fields)
         
         # Calculate checksum
-        checksum = 0
-        for char in sentence_body:
-            checksum ^= ord(char)
+        checksum = SentenceValidator.calculate_checksum(sentence_body)
         
         # Return complete sentence
-        return f"!{sentence_body}*{checksum:02X}"
+        return f"!{sentence_body}*{checksum}"
     
     @classmethod
     def from_binary_message(cls, binary_data: str, channel: str = 'A',
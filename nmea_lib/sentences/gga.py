@@ -1,11 +1,15 @@
 """GGA (Global Positioning System Fix Data) sentence implementation."""
 
-from typing import Optional
+from typing import Optional, Tuple
 from dataclasses import dataclass
 from ..base import Sentence, TalkerId, SentenceId, GpsFixQuality, PositionSentence, TimeSentence
-from ..parser import SentenceParser, SentenceBuilder
+from ..parser import SentenceParser
+from ..validator import SentenceValidator
 from ..types import Position, NMEATime, Distance, DistanceUnit
 
+# Sentence body after the time field; altitude and geoidal height carry their unit field
+_GGA_TAIL = "%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s"
+
 
 @dataclass
 class GGASentence(PositionSentence, TimeSentence):
@@ -64,12 +68,18 @@ class GGASentence(PositionSentence, TimeSentence):
         self._geoidal_height: Optional[Distance] = None
         self._dgps_age: Optional[float] = None
         self._dgps_station_id: Optional[str] = None
+        
+        # (body after the time field, its XOR checksum); cleared by every setter but set_time
+        self._tail: Optional[Tuple[str, int]] = None
     
     @classmethod
     def from_sentence(cls, nmea_sentence: str) -> 'GGASentence':
         """Create GGA sentence from NMEA string."""
-        parser = SentenceParser(nmea_sentence)
-        
+        return cls._from_parser(SentenceParser(nmea_sentence))
+    
+    @classmethod
+    def _from_parser(cls, parser: SentenceParser) -> 'GGASentence':
+        """Create GGA sentence from an already parsed NMEA string."""
         if parser.sentence_id != SentenceId.GGA:
             raise ValueError(f"Expected GGA sentence, got {parser.sentence_id}")
         
@@ -83,6 +93,8 @@ class GGASentence(PositionSentence, TimeSentence):
     
     def _parse_fields(self, parser: SentenceParser) -> None:
         """Parse fields from parser."""
+        self._tail = None
+        
         # Time
         time_str = parser.get_field(self.UTC_TIME)
         if time_str:
@@ -137,53 +149,49 @@ class GGASentence(PositionSentence, TimeSentence):
         self._dgps_station_id = dgps_id if dgps_id else None
     
     def to_sentence(self) -> str:
-        """Convert to NMEA sentence string."""
-        builder = SentenceBuilder(self.talker_id, self.sentence_id)
-        
-        # Time
-        if self._time:
-            builder.add_field(self._time.to_nmea())
-        else:
-            builder.add_field("")
+        """Convert to NMEA sentence string.
+
+        Everything after the time field is formatted and checksummed once
+        and reused until a setter other than set_time changes it, so a
+        steady-state tick only XORs the head and time bytes into the cached
+        checksum. Change fields through the setters, not in place.
+        """
+        tail = self._tail
+        if tail is None:
+            tail = self._tail = self._build_tail()
+        tail_str, tail_checksum = tail
         
-        # Position
-        if self._position:
+        head = f"{self.talker_id.value}{self.sentence_id.value},{self._time.to_nmea() if self._time is not None else ''},"
+        checksum = SentenceValidator.calculate_checksum_bytes(head.encode('ascii')) ^ tail_checksum
+        return f"${head}{tail_str}*{checksum:02X}\r\n"
+    
+    def _build_tail(self) -> Tuple[str, int]:
+        """Format the fields after the time field and compute their checksum."""
+        if self._position is not None:
             lat_str, lat_hem, lon_str, lon_hem = self._position.to_nmea()
-            builder.add_field(lat_str)
-            builder.add_field(lat_hem)
-            builder.add_field(lon_str)
-            builder.add_field(lon_hem)
         else:
-            builder.add_field("").add_field("").add_field("").add_field("")
+            lat_str = lat_hem = lon_str = lon_hem = ""
         
-        # Fix quality
-        builder.add_field(self._fix_quality.value)
-        
-        # Satellites in use
-        builder.add_field(self._satellites_in_use if self._satellites_in_use > 0 else "")
-        
-        # Horizontal dilution
-        builder.add_float_field(self._horizontal_dilution, 1)
-        
-        # Altitude
-        if self._altitude:
-            builder.add_float_field(self._altitude.value, 1)
-            builder.add_field("M")
-        else:
-            builder.add_field("").add_field("")
-        
-        # Geoidal height
-        if self._geoidal_height:
-            builder.add_float_field(self._geoidal_height.value, 1)
-            builder.add_field("M")
-        else:
-            builder.add_field("").add_field("")
-        
-        # DGPS data
-        builder.add_float_field(self._dgps_age, 1)
-        builder.add_field(self._dgps_station_id or "")
+        hdop = self._horizontal_dilution
+        altitude = self._altitude
+        geoidal_height = self._geoidal_height
+        dgps_age = self._dgps_age
         
-        return builder.build()
+        tail = _GGA_TAIL % (
+            lat_str,
+            lat_hem,
+            lon_str,
+            lon_hem,
+            self._fix_quality.value,
+            self._satellites_in_use if self._satellites_in_use > 0 else "",
+            "%.1f" % hdop if hdop is not None else "",
+            "%.1f,M" % altitude.value if altitude is not None else ",",
+            "%.1f,M" % geoidal_height.value if geoidal_height is not None else ",",
+            "%.1f" % dgps_age if dgps_age is not None else "",
+            self._dgps_station_id or "",
+        )
+        # XOR is associative, so the tail's share of the checksum can be kept apart
+        return tail, int(SentenceValidator.calculate_checksum(tail), 16)
     
     # Property accessors
     def get_time(self) -> Optional[str]:
@@ -218,6 +226,7 @@ class GGASentence(PositionSentence, TimeSentence):
     def set_position(self, latitude: float, longitude: float) -> None:
         """Set position coordinates."""
         self._position = Position(latitude, longitude)
+        self._tail = None
     
     def get_fix_quality(self) -> GpsFixQuality:
         """Get GPS fix quality."""
@@ -226,6 +235,7 @@ class GGASentence(PositionSentence, TimeSentence):
     def set_fix_quality(self, quality: GpsFixQuality) -> None:
         """Set GPS fix quality."""
         self._fix_quality = quality
+        self._tail = None
     
     def get_satellites_in_use(self) -> int:
         """Get number of satellites in use."""
@@ -234,6 +244,7 @@ class GGASentence(PositionSentence, TimeSentence):
     def set_satellites_in_use(self, count: int) -> None:
         """Set number of satellites in use."""
         self._satellites_in_use = max(0, count)
+        self._tail = None
     
     def get_horizontal_dilution(self) -> Optional[float]:
         """Get horizontal dilution of precision."""
@@ -242,6 +253,7 @@ class GGASentence(PositionSentence, TimeSentence):
     def set_horizontal_dilution(self, hdop: Optional[float]) -> None:
         """Set horizontal dilution of precision."""
         self._horizontal_dilution = hdop
+        self._tail = None
     
     def get_altitude(self) -> Optional[Distance]:
         """Get antenna altitude."""
@@ -250,6 +262,7 @@ class GGASentence(PositionSentence, TimeSentence):
     def set_altitude(self, altitude: Distance) -> None:
         """Set antenna altitude."""
         self._altitude = altitude
+        self._tail = None
     
     def get_geoidal_height(self) -> Optional[Distance]:
         """Get geoidal separation."""
@@ -258,6 +271,7 @@ class GGASentence(PositionSentence, TimeSentence):
     def set_geoidal_height(self, height: Distance) -> None:
         """Set geoidal separation."""
         self._geoidal_height = height
+        self._tail = None
     
     def get_dgps_age(self) -> Optional[float]:
         """Get age of DGPS data in seconds."""
@@ -266,6 +280,7 @@ class GGASentence(PositionSentence, TimeSentence):
     def set_dgps_age(self, age: Optional[float]) -> None:
         """Set age of DGPS data in seconds."""
         self._dgps_age = age
+        self._tail = None
     
     def get_dgps_station_id(self) -> Optional[str]:
         """Get DGPS station ID."""
@@ -274,4 +289,5 @@ class GGASentence(PositionSentence, TimeSentence):
     def set_dgps_station_id(self, station_id: Optional[str]) -> None:
         """Set DGPS station ID."""
         self._dgps_station_id = station_id
+        self._tail = None
 
@@ -65,8 +65,11 @@ class RMCSentence(PositionSentence, TimeSentence, DateSentence):
     @classmethod
     def from_sentence(cls, nmea_sentence: str) -> 'RMCSentence':
         """Create RMC sentence from NMEA string."""
-        parser = SentenceParser(nmea_sentence)
-        
+        return cls._from_parser(SentenceParser(nmea_sentence))
+    
+    @classmethod
+    def _from_parser(cls, parser: SentenceParser) -> 'RMCSentence':
+        """Create RMC sentence from an already parsed NMEA string."""
         if parser.sentence_id != SentenceId.RMC:
             raise ValueError(f"Expected RMC sentence, got {parser.sentence_id}")
         
@@ -6,7 +6,7 @@ from .units import Speed, Bearing, Distance, SpeedUnit, BearingType, DistanceUni
 from .enums import *
 from .vessel import (
     VesselState, VesselStaticData, VesselNavigationData, VesselVoyageData,
-    VesselDimensions, VesselETA, BaseStationData, AidToNavigationData,
+    VesselDimensions, VesselETA, BaseStationData, AidToNavigationData, VesselFleet,
     create_vessel_state, create_base_station, create_aid_to_navigation
 )
 
@@ -17,7 +17,7 @@ __all__ = [
     'SpeedUnit', 'BearingType', 'DistanceUnit',
     'CompassPoint', 'FaaMode', 'NavStatus', 'GsaMode', 'GsaFixType', 'DataStatus', 'ModeIndicator',
     'VesselState', 'VesselStaticData', 'VesselNavigationData', 'VesselVoyageData',
-    'VesselDimensions', 'VesselETA', 'BaseStationData', 'AidToNavigationData',
+    'VesselDimensions', 'VesselETA', 'BaseStationData', 'AidToNavigationData', 'VesselFleet',
     'create_vessel_state', 'create_base_station', 'create_aid_to_navigation'
 ]
 
@@ -1,9 +1,33 @@
 """Position-related data types for NMEA sentences."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from typing import Optional, Tuple
 import math
+import re
+
+import numpy as np
+
+try:
+    from .._haversine import haversine_m as _haversine_m # Optional Cython kernel
+except ImportError:
+    _haversine_m = None
+
+if _haversine_m is None:
+    try:
+        from numba import njit # Optional JIT when the Cython kernel is not built
+    except ImportError:
+        pass
+    else:
+        @njit(cache=True, fastmath=True)
+        def _haversine_m(lat1, lon1, lat2, lon2):
+            phi1 = math.radians(lat1)
+            phi2 = math.radians(lat2)
+            dphi = phi2 - phi1
+            dlambda = math.radians(lon2 - lon1)
+            a = math.sin(dphi * 0.5) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda * 0.5) ** 2
+            return 2 * 6371000.0 * math.atan2(math.sqrt(a), math.sqrt(1.0 - a if a < 1.0 else 0.0))
 
 
 class Hemisphere(Enum):
@@ -14,12 +38,54 @@ class Hemisphere(Enum):
     WEST = "W"
 
 
-@dataclass
+# Fields already in the exact layout to_nmea() emits (4 minute decimals, minutes < 60)
+_CANONICAL_LAT = re.compile(r'[0-9]{2}[0-5][0-9]\.[0-9]{4}')
+_CANONICAL_LON = re.compile(r'[0-9]{3}[0-5][0-9]\.[0-9]{4}')
+
+
+@lru_cache(maxsize=1024)
+def _parse_nmea_coordinates(lat_str: str, lat_hem: str, lon_str: str, lon_hem: str) -> Tuple[float, float, Optional[tuple]]:
+    """Decimal-degree (latitude, longitude) for NMEA DDMM.MMMM/DDDMM.MMMM fields.
+
+    The third item is the to_nmea() result for those coordinates when the
+    input fields already spell it (canonical layout), else None; this lets
+    an unchanged position re-emit the received text without formatting.
+
+    Cached because replayed or stationary feeds repeat the same fields.
+    Positions are mutable, so callers build a new Position from the result.
+    """
+    # Parse latitude (DDMM.MMMM format)
+    lat_degrees = int(lat_str[:2])
+    lat_minutes = float(lat_str[2:])
+    latitude = lat_degrees + lat_minutes / 60.0
+    
+    if lat_hem.upper() == Hemisphere.SOUTH.value:
+        latitude = -latitude
+    
+    # Parse longitude (DDDMM.MMMM format)
+    lon_degrees = int(lon_str[:3])
+    lon_minutes = float(lon_str[3:])
+    longitude = lon_degrees + lon_minutes / 60.0
+    
+    if lon_hem.upper() == Hemisphere.WEST.value:
+        longitude = -longitude
+    
+    nmea = None
+    if _CANONICAL_LAT.fullmatch(lat_str) and _CANONICAL_LON.fullmatch(lon_str):
+        nmea = (lat_str, Hemisphere.NORTH.value if latitude >= 0 else Hemisphere.SOUTH.value,
+                lon_str, Hemisphere.EAST.value if longitude >= 0 else Hemisphere.WEST.value)
+    
+    return latitude, longitude, nmea
+
+
+@dataclass(slots=True)
 class Position:
     """Represents a geographic position with latitude and longitude."""
     
     latitude: float  # Decimal degrees
     longitude: float  # Decimal degrees
+    # ((latitude, longitude), to_nmea() result) for the coordinates last formatted
+    _nmea_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate position coordinates."""
@@ -34,26 +100,23 @@ class Position:
         if not all([lat_str, lat_hem, lon_str, lon_hem]):
             raise ValueError("Missing position data")
         
-        # Parse latitude (DDMM.MMMM format)
-        lat_degrees = int(lat_str[:2])
-        lat_minutes = float(lat_str[2:])
-        latitude = lat_degrees + lat_minutes / 60.0
-        
-        if lat_hem.upper() == Hemisphere.SOUTH.value:
-            latitude = -latitude
-        
-        # Parse longitude (DDDMM.MMMM format)
-        lon_degrees = int(lon_str[:3])
-        lon_minutes = float(lon_str[3:])
-        longitude = lon_degrees + lon_minutes / 60.0
-        
-        if lon_hem.upper() == Hemisphere.WEST.value:
-            longitude = -longitude
-        
-        return cls(latitude, longitude)
+        latitude, longitude, nmea = _parse_nmea_coordinates(lat_str, lat_hem, lon_str, lon_hem)
+        position = cls(latitude, longitude)
+        if nmea is not None:
+            position._nmea_cache = ((latitude, longitude), nmea)
+        return position
     
     def to_nmea(self) -> Tuple[str, str, str, str]:
-        """Convert position to NMEA format strings."""
+        """Convert position to NMEA format strings.
+
+        The result is cached per instance and reused while the coordinates
+        are unchanged (e.g. a stationary vessel re-emitting every tick).
+        """
+        key = (self.latitude, self.longitude)
+        cached = self._nmea_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        
         # Latitude
         lat_abs = abs(self.latitude)
         lat_deg = int(lat_abs)
@@ -68,10 +131,15 @@ class Position:
         lon_str = f"{lon_deg:03d}{lon_min:07.4f}"
         lon_hem = Hemisphere.EAST.value if self.longitude >= 0 else Hemisphere.WEST.value
         
-        return lat_str, lat_hem, lon_str, lon_hem
+        result = (lat_str, lat_hem, lon_str, lon_hem)
+        self._nmea_cache = (key, result)
+        return result
     
     def distance_to(self, other: 'Position') -> float:
         """Calculate distance to another position in meters using Haversine formula."""
+        if _haversine_m is not None:
+            return _haversine_m(self.latitude, self.longitude, other.latitude, other.longitude)
+        
         lat1_rad = math.radians(self.latitude)
         lon1_rad = math.radians(self.longitude)
         lat2_rad = math.radians(other.latitude)
@@ -82,12 +150,30 @@ class Position:
         
         a = (math.sin(dlat / 2) ** 2 + 
              math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon / 2) ** 2)
-        c = 2 * math.asin(math.sqrt(a))
+        # atan2 form stays well-conditioned near antipodal points (a -> 1)
+        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1.0 - a if a < 1.0 else 0.0))
         
         # Earth's radius in meters
         earth_radius = 6371000
         return earth_radius * c
     
+    @staticmethod
+    def distance_to_many(lat1, lon1, lat2, lon2) -> np.ndarray:
+        """Haversine distances in meters between arrays of positions.
+
+        Vectorized counterpart of distance_to(): takes decimal-degree
+        coordinates as scalars or array-likes (broadcast against each other)
+        and returns an array of distances. Use it when many pairs are
+        needed; for a single pair distance_to() avoids the NumPy overhead.
+        """
+        phi1 = np.radians(lat1)
+        phi2 = np.radians(lat2)
+        dphi = phi2 - phi1
+        dlambda = np.radians(np.subtract(lon2, lon1))
+        a = np.sin(dphi * 0.5) ** 2 + np.cos(phi1) * np.cos(phi2) * np.sin(dlambda * 0.5) ** 2
+        # Clip guards against a marginally > 1 from rounding for antipodal points
+        return 2 * 6371000.0 * np.arctan2(np.sqrt(a), np.sqrt(np.maximum(1.0 - a, 0.0)))
+    
     def bearing_to(self, other: 'Position') -> float:
         """Calculate bearing to another position in degrees."""
         lat1_rad = math.radians(self.latitude)
@@ -2,9 +2,11 @@
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, Iterable, Sequence
 from enum import Enum
 
+import numpy as np
+
 from nmea_lib.types import Position, Speed, Bearing
 from nmea_lib.ais.constants import (
     NavigationStatus, ShipType, EPFDType, VesselClass,
@@ -277,6 +279,122 @@ class VesselState:
                 self.voyage_data.validate())
 
 
+class VesselFleet:
+    """Navigation data for many vessels stored as parallel NumPy arrays.
+
+    Each navigation field is one array indexed by fleet slot, so a tick
+    that moves every vessel (advance()) is a handful of array operations
+    instead of a Python loop over VesselNavigationData objects. Vessels
+    are addressed by MMSI; view() builds a VesselNavigationData for one
+    vessel when it is needed, e.g. for message encoding.
+    """
+    
+    def __init__(self, mmsis: Sequence[int]):
+        """Create a fleet for the given MMSIs with AIS "not available" defaults."""
+        n = len(mmsis)
+        self.mmsi = np.asarray(mmsis, dtype=np.int64)
+        self._slots: Dict[int, int] = {int(mmsi): i for i, mmsi in enumerate(self.mmsi)}
+        if len(self._slots) != n:
+            raise ValueError("Duplicate MMSI in fleet")
+        
+        self.lat = np.zeros(n, dtype=np.float64)          # Decimal degrees
+        self.lon = np.zeros(n, dtype=np.float64)          # Decimal degrees
+        self.sog = np.zeros(n, dtype=np.float64)          # Knots
+        self.cog = np.zeros(n, dtype=np.float64)          # Degrees
+        self.heading = np.full(n, 511, dtype=np.int16)
+        self.nav_status = np.full(n, NavigationStatus.DEFAULT, dtype=np.int8)
+        self.rot = np.full(n, 128, dtype=np.int16)
+        self.timestamp = np.full(n, 60, dtype=np.int8)
+        self.position_accuracy = np.zeros(n, dtype=np.int8)
+        self.raim = np.zeros(n, dtype=np.int8)
+        self.radio_status = np.zeros(n, dtype=np.int32)    # 19-bit communication state
+    
+    @classmethod
+    def from_states(cls, states: Iterable[VesselState]) -> 'VesselFleet':
+        """Create a fleet holding the navigation data of the given vessel states."""
+        states = list(states)
+        fleet = cls([state.mmsi for state in states])
+        for state in states:
+            fleet.update(state.mmsi, state.navigation_data)
+        return fleet
+    
+    def __len__(self) -> int:
+        return len(self.mmsi)
+    
+    def __contains__(self, mmsi: int) -> bool:
+        return mmsi in self._slots
+    
+    def slot(self, mmsi: int) -> int:
+        """Get the array index of a vessel."""
+        try:
+            return self._slots[mmsi]
+        except KeyError:
+            raise KeyError(f"MMSI {mmsi} not in fleet") from None
+    
+    def update(self, mmsi: int, navigation_data: VesselNavigationData) -> None:
+        """Store one vessel's navigation data in the fleet arrays."""
+        i = self.slot(mmsi)
+        self.lat[i] = navigation_data.position.latitude
+        self.lon[i] = navigation_data.position.longitude
+        self.sog[i] = navigation_data.sog
+        self.cog[i] = navigation_data.cog
+        self.heading[i] = navigation_data.heading
+        self.nav_status[i] = navigation_data.nav_status
+        self.rot[i] = navigation_data.rot
+        self.timestamp[i] = navigation_data.timestamp
+        self.position_accuracy[i] = navigation_data.position_accuracy
+        self.raim[i] = navigation_data.raim
+        self.radio_status[i] = navigation_data.radio_status
+    
+    def view(self, mmsi: int) -> VesselNavigationData:
+        """Get one vessel's navigation data as a VesselNavigationData.
+
+        The result is a snapshot; write changes back with update().
+        """
+        i = self.slot(mmsi)
+        return VesselNavigationData(
+            position=Position(float(self.lat[i]), float(self.lon[i])),
+            sog=float(self.sog[i]),
+            cog=float(self.cog[i]),
+            heading=int(self.heading[i]),
+            nav_status=NavigationStatus(int(self.nav_status[i])),
+            rot=int(self.rot[i]),
+            timestamp=int(self.timestamp[i]),
+            position_accuracy=int(self.position_accuracy[i]),
+            raim=int(self.raim[i]),
+            radio_status=int(self.radio_status[i]),
+        )
+    
+    def advance(self, elapsed_seconds: float) -> None:
+        """Move every vessel along its course at its speed over ground.
+
+        Same great-circle step as Position.move_by_bearing_distance, applied
+        to the whole fleet at once.
+        """
+        earth_radius = 6371000  # meters
+        
+        angular_distance = self.sog * (0.514444 * elapsed_seconds / earth_radius)
+        lat1_rad = np.radians(self.lat)
+        bearing_rad = np.radians(self.cog)
+        sin_lat1 = np.sin(lat1_rad)
+        cos_lat1 = np.cos(lat1_rad)
+        sin_d = np.sin(angular_distance)
+        cos_d = np.cos(angular_distance)
+        
+        lat2_rad = np.arcsin(sin_lat1 * cos_d + cos_lat1 * sin_d * np.cos(bearing_rad))
+        dlon_rad = np.arctan2(np.sin(bearing_rad) * sin_d * cos_lat1,
+                              cos_d - sin_lat1 * np.sin(lat2_rad))
+        
+        # In place, so references to the coordinate arrays stay current
+        np.degrees(np.radians(self.lon) + dlon_rad, out=self.lon)
+        np.degrees(lat2_rad, out=self.lat)
+        
+        # Wrap across the antimeridian into [-180, 180)
+        self.lon += 180.0
+        np.mod(self.lon, 360.0, out=self.lon)
+        self.lon -= 180.0
+
+
 # Factory functions for creating vessel states
 def create_vessel_state(mmsi: int, vessel_name: str, position: Position,
                        vessel_class: VesselClass = VesselClass.CLASS_A,
@@ -3,6 +3,8 @@
 import re
 from typing import Optional
 
+from ._lex import LexedSentence, checksum_hex, lex, xor_bytes
+
 
 class SentenceValidator:
     """Validates NMEA sentence format and checksum."""
@@ -32,11 +34,23 @@ class SentenceValidator:
     
     @staticmethod
     def calculate_checksum(sentence_body: str) -> str:
-        """Calculate NMEA checksum for sentence body (without $ and *)."""
-        checksum = 0
-        for char in sentence_body:
-            checksum ^= ord(char)
-        return f"{checksum:02X}"
+        """Calculate NMEA checksum for sentence body (without $ and *).
+
+        SWAR XOR fold: the ASCII body is read as one integer and its upper
+        half repeatedly XORed onto its lower half until one byte remains, so
+        a sentence costs a few integer operations rather than a loop per
+        character (see calculate_checksum_bytes for long bodies).
+        """
+        return checksum_hex(sentence_body)
+    
+    @staticmethod
+    def calculate_checksum_bytes(buf: bytes) -> int:
+        """Calculate the NMEA checksum of an ASCII-encoded body as an integer.
+
+        Bodies longer than 128 bytes (e.g. bulk replay buffers) are reduced
+        with NumPy's vectorized bitwise_xor; shorter ones use the integer fold.
+        """
+        return xor_bytes(buf)
     
     @staticmethod
     def validate_checksum(sentence: str) -> bool:
@@ -66,11 +80,23 @@ class SentenceValidator:
         except (ValueError, IndexError):
             return False
     
+    @staticmethod
+    def scan(sentence: str) -> Optional[LexedSentence]:
+        """Validate a sentence in a single pass, returning its components.
+
+        Returns None unless the sentence is both well-formed and carries a
+        correct checksum, i.e. exactly when is_valid() is False.
+        """
+        lexed = lex(sentence)
+        if lexed is None or lexed[3].upper() != lexed[4]:
+            return None
+        return lexed
+    
     @staticmethod
     def is_valid(sentence: str) -> bool:
         """Perform complete validation of NMEA sentence."""
-        return (SentenceValidator.is_valid_format(sentence) and 
-                SentenceValidator.validate_checksum(sentence))
+        lexed = lex(sentence)
+        return lexed is not None and lexed[3].upper() == lexed[4]
     
     @staticmethod
     def extract_talker_id(sentence: str) -> Optional[str]:
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """Setup script for Python NMEA 0183 Simulator."""
 
-from setuptools import setup, find_packages
+from setuptools import Extension, setup, find_packages
 
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
@@ -9,6 +9,17 @@ with open("README.md", "r", encoding="utf-8") as fh:
 with open("requirements.txt", "r", encoding="utf-8") as fh:
     requirements = [line.strip() for line in fh if line.strip() and not line.startswith("#")]
 
+# Optional compiled kernels; nmea_lib falls back to pure Python without them
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = cythonize(
+        [Extension("nmea_lib._haversine", ["nmea_lib/_haversine.pyx"], optional=True)],
+        language_level=3,
+    )
+
 setup(
     name="nmea-simulator",
     version="1.0.0",
@@ -19,21 +30,23 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/nmea-simulator/nmea-simulator",
     packages=find_packages(),
+    ext_modules=ext_modules,
+    extras_require={
+        "fast": ["numba>=0.57"],
+    },
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
         "Topic :: Scientific/Engineering :: GIS",
         "Topic :: Software Development :: Testing",
         "Topic :: System :: Networking",
     ],
-    python_requires=">=3.8",
+    python_requires=">=3.10",
     install_requires=requirements,
     entry_points={
         "console_scripts": [
@@ -171,36 +171,23 @@ class ConfigParser:
                 bytesize=output_data.get('bytesize', 'EIGHTBITS'), # Keep as string for config flexibility
                 parity=output_data.get('parity', 'PARITY_NONE'),   # Keep as string
                 stopbits=output_data.get('stopbits', 'STOPBITS_ONE'), # Keep as string
-                timeout=output_data.get('timeout'), # Allow None by not providing default here if that's desired
-                write_timeout=output_data.get('write_timeout'), # Allow None
+                # A missing or null timeout is passed as None (no timeout)
+                timeout=None if output_data.get('timeout') is None else float(output_data['timeout']),
+                write_timeout=None if output_data.get('write_timeout') is None else float(output_data['write_timeout']),
                 rtscts=bool(output_data.get('rtscts', False)),
                 dsrdtr=bool(output_data.get('dsrdtr', False)),
                 xonxoff=bool(output_data.get('xonxoff', False)),
                 exclusive=bool(output_data.get('exclusive', True)),
                 send_interval=float(output_data.get('send_interval', 0.1)),
                 reconnect_delay=float(output_data.get('reconnect_delay', 5.0)),
+                max_reconnect_delay=float(output_data.get('max_reconnect_delay', 60.0)),
                 max_reconnect_attempts=int(output_data.get('max_reconnect_attempts', 5)),
-                line_ending=str(output_data.get('line_ending', '\r\n'))
+                line_ending=str(output_data.get('line_ending', '\r\n')),
+                tx_queue_size=int(output_data.get('tx_queue_size', 1024)),
+                max_batch_size=int(output_data.get('max_batch_size', 64)),
+                coalesce_delay_ms=float(output_data.get('coalesce_delay_ms', 0.0)),
+                single_producer=bool(output_data.get('single_producer', False))
             )
-            # Handle optional timeout values more carefully:
-            # If timeout/write_timeout is specified in YAML as null/None, it should pass as None.
-            # If it's missing, it will default to None in SerialOutputConfig or its __post_init__ can set a default.
-            # The current SerialOutputConfig defaults them to 1.0, so missing means 1.0.
-            # If we want to allow YAML to explicitly set it to None to override the dataclass default,
-            # we might need to adjust SerialOutputConfig or handle it here.
-            # For now, `output_data.get('timeout')` will pass None if key is missing or value is null.
-            # SerialOutputConfig.__post_init__ will then use its default of 1.0.
-            # If YAML has `timeout: null`, it will be None.
-            if 'timeout' in output_data and output_data['timeout'] is not None:
-                config.timeout = float(output_data['timeout'])
-            elif 'timeout' not in output_data: # Key missing, rely on dataclass default
-                 pass # SerialOutputConfig will use its default of 1.0
-
-            if 'write_timeout' in output_data and output_data['write_timeout'] is not None:
-                config.write_timeout = float(output_data['write_timeout'])
-            elif 'write_timeout' not in output_data: # Key missing, rely on dataclass default
-                 pass # SerialOutputConfig will use its default of 1.0
-        
         else:
             raise ValueError(f"Unknown output type: {output_type}")
         
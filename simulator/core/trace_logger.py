@@ -1,31 +1,147 @@
 """AIS trace logging system for detailed message analysis."""
 
 import json
+import heapq
 import logging
+from collections import deque
+from operator import attrgetter
 from datetime import datetime
-from typing import Dict, Any, List, Optional, TextIO
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, TextIO
 from pathlib import Path
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
 import threading
+import time
 from queue import Queue, Empty
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class TraceEntry:
-    """Single trace log entry."""
+    """Single trace log entry (immutable once queued)."""
     timestamp: str
     event_type: str
     vessel_mmsi: int
     message_type: Optional[int] = None
-    data: Optional[Dict[str, Any]] = None
+    data: Optional[Mapping[str, Any]] = None
     sentences: Optional[List[str]] = None
-    input_data: Optional[Dict[str, Any]] = None
+    input_data: Optional[Mapping[str, Any]] = None
     processing_time_ms: Optional[float] = None
     errors: Optional[List[str]] = None
 
 
+def _freeze(mapping: Optional[Mapping[str, Any]]) -> Optional[Mapping[str, Any]]:
+    """Wrap a caller-supplied dict in a read-only view instead of copying it."""
+    return None if mapping is None else MappingProxyType(mapping)
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize read-only mapping views produced by _freeze()."""
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# Compact JSON encoder shared by all trace writers (avoids rebuilding an
+# encoder on every json.dumps call with non-default separators).
+_json_encode = json.JSONEncoder(separators=(',', ':'), default=_json_default).encode
+
+# TraceEntry fields populated by each AISTraceLogger.log_* method. Fields not
+# listed are always None for that event type and are emitted as literal null.
+_EVENT_SCHEMAS: Dict[str, tuple] = {
+    'message_generated': ('message_type', 'sentences', 'input_data', 'processing_time_ms'),
+    'message_transmitted': ('message_type', 'sentences', 'data'),
+    'vessel_updated': ('data',),
+    'message_scheduled': ('message_type', 'data'),
+    'error': ('data', 'errors'),
+    'binary_encoded': ('message_type', 'data'),
+    'sentence_validated': ('data',),
+}
+
+
+def _build_entry_encoder(event_type: str, populated: tuple):
+    """Generate a fixed-schema JSON encoder for one event type.
+
+    The key layout and constant fields are baked into a single %-format
+    template; only the populated fields are encoded at call time.
+    """
+    parts = []
+    args = []
+    for entry_field in fields(TraceEntry):
+        name = entry_field.name
+        if name == 'event_type':
+            parts.append('"event_type":' + _json_encode(event_type).replace('%', '%%'))
+        elif name == 'timestamp':
+            # Timestamps come from datetime.isoformat() and never need escaping
+            parts.append('"timestamp":"%s"')
+            args.append('e.timestamp')
+        elif name == 'vessel_mmsi':
+            parts.append('"vessel_mmsi":%d')
+            args.append('e.vessel_mmsi')
+        elif name in populated:
+            parts.append(f'"{name}":%s')
+            args.append(f'_encode(e.{name})')
+        else:
+            parts.append(f'"{name}":null')
+
+    template = '{' + ','.join(parts) + '}'
+    func_name = '_encode_' + event_type
+    source = (f"def {func_name}(e, _encode=_encode):\n"
+              f"    return {template!r} % ({', '.join(args)},)\n")
+    namespace = {'_encode': _json_encode}
+    exec(compile(source, f'<trace encoder {event_type}>', 'exec'), namespace)
+    return namespace[func_name]
+
+
+_ENTRY_ENCODERS = {
+    event_type: _build_entry_encoder(event_type, populated)
+    for event_type, populated in _EVENT_SCHEMAS.items()
+}
+
+
+def encode_trace_entry(entry: TraceEntry) -> str:
+    """Serialize a trace entry to a compact JSON line (without newline)."""
+    encoder = _ENTRY_ENCODERS.get(entry.event_type)
+    if encoder is not None:
+        return encoder(entry)
+    return _json_encode({f.name: getattr(entry, f.name) for f in fields(TraceEntry)})
+
+
+class _MMSIBitset:
+    """Fixed-size bitset counting distinct vessel MMSIs.
+
+    MMSIs are folded onto 2**24 bits (2 MiB), so memory stays constant on
+    long runs. Two MMSIs sharing their low 24 bits are counted once.
+    """
+
+    MASK = 0xFFFFFF
+
+    def __init__(self):
+        self._bits = bytearray((self.MASK + 1) >> 3)
+        self._count = 0
+
+    def add(self, mmsi: int) -> None:
+        """Mark an MMSI as seen."""
+        index = mmsi & self.MASK
+        byte_index = index >> 3
+        bit = 1 << (index & 7)
+        current = self._bits[byte_index]
+        if not current & bit:
+            self._bits[byte_index] = current | bit
+            self._count += 1
+
+    def __len__(self) -> int:
+        return self._count
+
+
 class AISTraceLogger:
-    """Comprehensive trace logging for AIS message generation and processing."""
+    """Comprehensive trace logging for AIS message generation and processing.
+    
+    Dicts passed to the log_* methods are stored as read-only views, not
+    copies, and are serialized later on the writer thread. Callers must not
+    mutate them after logging.
+    """
     
     def __init__(self, log_file: Optional[str] = None, 
                  enable_console: bool = False,
@@ -39,6 +155,8 @@ class AISTraceLogger:
         self.log_queue: Queue = Queue(maxsize=max_queue_size)
         self.running = False
         self.log_thread: Optional[threading.Thread] = None
+        # Set by producers after queueing an entry, and by stop()
+        self._wake = threading.Event()
         
         # File handle
         self.file_handle: Optional[TextIO] = None
@@ -47,12 +165,18 @@ class AISTraceLogger:
         self.stats = {
             'entries_logged': 0,
             'entries_dropped': 0,
-            'start_time': None,
             'message_types': {},
-            'vessels': set(),
+            'vessels': _MMSIBitset(),
             'errors': 0
         }
         
+        # Runtime basis: monotonic clock for durations, wall clock for display
+        self._start_monotonic: Optional[float] = None
+        self._start_wall: Optional[float] = None
+        
+        # Most recent error entries, kept for get_statistics()
+        self._recent_errors: deque = deque(maxlen=10)
+        
         # Setup logging
         self.logger = logging.getLogger(f"{__name__}.AISTraceLogger")
     
@@ -62,7 +186,8 @@ class AISTraceLogger:
             return
         
         self.running = True
-        self.stats['start_time'] = datetime.now()
+        self._start_monotonic = time.monotonic()
+        self._start_wall = time.time()
         
         # Open log file if specified
         if self.log_file:
@@ -81,6 +206,7 @@ class AISTraceLogger:
             return
         
         self.running = False
+        self._wake.set()
         
         # Wait for log thread to finish
         if self.log_thread and self.log_thread.is_alive():
@@ -103,7 +229,7 @@ class AISTraceLogger:
             vessel_mmsi=vessel_mmsi,
             message_type=message_type,
             sentences=sentences,
-            input_data=input_data,
+            input_data=_freeze(input_data),
             processing_time_ms=processing_time_ms
         )
         
@@ -129,7 +255,7 @@ class AISTraceLogger:
             timestamp=datetime.now().isoformat(),
             event_type='vessel_updated',
             vessel_mmsi=vessel_mmsi,
-            data=position_data
+            data=_freeze(position_data)
         )
         
         self._queue_entry(entry)
@@ -142,7 +268,7 @@ class AISTraceLogger:
             event_type='message_scheduled',
             vessel_mmsi=vessel_mmsi,
             message_type=message_type,
-            data=event_data
+            data=_freeze(event_data)
         )
         
         self._queue_entry(entry)
@@ -155,11 +281,12 @@ class AISTraceLogger:
             event_type='error',
             vessel_mmsi=vessel_mmsi,
             errors=[error_message],
-            data=context
+            data=_freeze(context)
         )
         
         self._queue_entry(entry)
         self.stats['errors'] += 1
+        self._recent_errors.append(entry)
     
     def log_binary_encoding(self, vessel_mmsi: int, message_type: int,
                           binary_data: str, encoded_payload: str,
@@ -201,6 +328,7 @@ class AISTraceLogger:
         """Queue a trace entry for logging."""
         try:
             self.log_queue.put_nowait(entry)
+            self._wake.set()
         except:
             # Queue is full, drop the entry
             self.stats['entries_dropped'] += 1
@@ -208,12 +336,16 @@ class AISTraceLogger:
     def _log_worker(self):
         """Worker thread for processing log entries."""
         while self.running or not self.log_queue.empty():
+            # Sleep until an entry is queued or stop() is called; both set
+            # the event after their change is visible, so no timeout is needed
+            self._wake.wait()
+            self._wake.clear()
+            
             try:
-                # Get entry from queue with timeout
-                entry = self.log_queue.get(timeout=1.0)
-                self._write_entry(entry)
-                self.log_queue.task_done()
-                
+                while True:
+                    entry = self.log_queue.get_nowait()
+                    self._write_entry(entry)
+                    self.log_queue.task_done()
             except Empty:
                 continue
             except Exception as e:
@@ -233,8 +365,7 @@ class AISTraceLogger:
                 self.stats['message_types'][msg_type] += 1
             
             # Convert to JSON
-            entry_dict = asdict(entry)
-            json_line = json.dumps(entry_dict, separators=(',', ':'))
+            json_line = encode_trace_entry(entry)
             
             # Write to file
             if self.file_handle:
@@ -250,14 +381,33 @@ class AISTraceLogger:
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get trace logging statistics."""
-        stats = self.stats.copy()
-        stats['vessels'] = len(stats['vessels'])
+        stats = {
+            'entries_logged': self.stats['entries_logged'],
+            'entries_dropped': self.stats['entries_dropped'],
+            'start_time': None,
+            'message_types': self.stats['message_types'],
+            'vessels': len(self.stats['vessels']),
+            'errors': self.stats['errors']
+        }
         
-        if stats['start_time']:
-            runtime = (datetime.now() - stats['start_time']).total_seconds()
+        if self._start_monotonic is not None:
+            runtime = time.monotonic() - self._start_monotonic
+            stats['start_time'] = datetime.fromtimestamp(self._start_wall)
             stats['runtime_seconds'] = runtime
             stats['entries_per_second'] = stats['entries_logged'] / max(1, runtime)
         
+        # Snapshot first: log_error() appends from other threads while the entries are formatted
+        recent_errors = list(self._recent_errors)
+        stats['recent_errors'] = [
+            {
+                'timestamp': entry.timestamp,
+                'vessel_mmsi': entry.vessel_mmsi,
+                'errors': entry.errors,
+                'context': dict(entry.data) if entry.data is not None else None
+            }
+            for entry in reversed(recent_errors)
+        ]
+        
         return stats
     
     def flush(self):
@@ -273,6 +423,12 @@ class TraceAnalyzer:
         """Initialize trace analyzer."""
         self.trace_file = trace_file
         self.entries: List[TraceEntry] = []
+        
+        # Column arrays for 'message_generated' entries, filled by _load_entries
+        self._gen_msg_types = np.empty(0, dtype=np.int64)
+        self._gen_vessel_mmsi = np.empty(0, dtype=np.int64)
+        self._gen_processing_ms = np.empty(0, dtype=np.float64)
+        
         self._load_entries()
     
     def _load_entries(self):
@@ -280,6 +436,10 @@ class TraceAnalyzer:
         if not Path(self.trace_file).exists():
             raise FileNotFoundError(f"Trace file not found: {self.trace_file}")
         
+        msg_types: List[int] = []
+        vessel_mmsi: List[int] = []
+        processing_ms: List[float] = []
+        
         with open(self.trace_file, 'r') as f:
             for line_num, line in enumerate(f, 1):
                 try:
@@ -288,39 +448,48 @@ class TraceAnalyzer:
                     self.entries.append(entry)
                 except Exception as e:
                     print(f"Error parsing line {line_num}: {e}")
+                    continue
+                
+                # AIS message types are small positive integers
+                if entry.message_type and entry.message_type > 0 and entry.event_type == 'message_generated':
+                    msg_types.append(entry.message_type)
+                    vessel_mmsi.append(entry.vessel_mmsi)
+                    processing_ms.append(entry.processing_time_ms or 0.0)
+        
+        self._gen_msg_types = np.array(msg_types, dtype=np.int64)
+        self._gen_vessel_mmsi = np.array(vessel_mmsi, dtype=np.int64)
+        self._gen_processing_ms = np.array(processing_ms, dtype=np.float64)
     
     def get_vessel_messages(self, vessel_mmsi: int) -> List[TraceEntry]:
         """Get all messages for a specific vessel."""
         return [entry for entry in self.entries if entry.vessel_mmsi == vessel_mmsi]
     
     def get_message_type_stats(self) -> Dict[int, Dict[str, Any]]:
-        """Get statistics by message type."""
-        stats = {}
+        """Get statistics by message type, ordered by message type."""
+        if not self._gen_msg_types.size:
+            return {}
         
-        for entry in self.entries:
-            if entry.message_type and entry.event_type == 'message_generated':
-                msg_type = entry.message_type
-                if msg_type not in stats:
-                    stats[msg_type] = {
-                        'count': 0,
-                        'vessels': set(),
-                        'avg_processing_time': 0,
-                        'total_processing_time': 0
-                    }
-                
-                stats[msg_type]['count'] += 1
-                stats[msg_type]['vessels'].add(entry.vessel_mmsi)
-                
-                if entry.processing_time_ms:
-                    stats[msg_type]['total_processing_time'] += entry.processing_time_ms
+        msg_types = self._gen_msg_types
+        counts = np.bincount(msg_types)
+        totals = np.bincount(msg_types, weights=self._gen_processing_ms)
         
-        # Calculate averages
-        for msg_type in stats:
-            if stats[msg_type]['count'] > 0:
-                stats[msg_type]['avg_processing_time'] = (
-                    stats[msg_type]['total_processing_time'] / stats[msg_type]['count']
-                )
-            stats[msg_type]['vessels'] = len(stats[msg_type]['vessels'])
+        # Distinct (type, vessel) pairs packed into one int64 key (MMSIs fit in 32 bits)
+        pair_keys = np.sort((msg_types << 32) | (self._gen_vessel_mmsi & 0xFFFFFFFF))
+        is_first = np.empty(pair_keys.size, dtype=bool)
+        is_first[0] = True
+        np.not_equal(pair_keys[1:], pair_keys[:-1], out=is_first[1:])
+        vessels = np.bincount(pair_keys[is_first] >> 32, minlength=counts.size)
+        
+        stats = {}
+        for msg_type in np.flatnonzero(counts).tolist():
+            count = int(counts[msg_type])
+            total = float(totals[msg_type])
+            stats[msg_type] = {
+                'count': count,
+                'vessels': int(vessels[msg_type]),
+                'avg_processing_time': total / count,
+                'total_processing_time': total
+            }
         
         return stats
     
@@ -359,7 +528,7 @@ class TraceAnalyzer:
                     error_summary['error_types'][error] += 1
         
         # Get recent errors (last 10)
-        recent_errors = sorted(error_entries, key=lambda x: x.timestamp, reverse=True)[:10]
+        recent_errors = heapq.nlargest(10, error_entries, key=attrgetter('timestamp'))
         error_summary['recent_errors'] = [
             {
                 'timestamp': entry.timestamp,
@@ -15,6 +15,10 @@ class OutputHandler(ABC):
         # Changed to use time.time() for consistency with other modules
         self.start_time: float = time.time()
         self.last_sentence_time: float = time.time()
+        # Monotonic counterpart of start_time, used for uptime (immune to clock steps)
+        self._start_monotonic: float = time.monotonic()
+        # (whole second, ISO string) of the last formatted last_sentence_time
+        self._cached_iso = (None, '')
     
     @abstractmethod
     def start(self) -> None:
@@ -41,24 +45,31 @@ class OutputHandler(ABC):
     
     def get_status(self) -> Dict[str, Any]:
         """Get output handler status information."""
-        current_time = time.time()
-        uptime = (current_time - self.start_time) if self.is_running and self.start_time else 0
+        uptime = (time.monotonic() - self._start_monotonic) if self.is_running else 0
         
         return {
             'running': self.is_running,
             'sentences_sent': self.sentences_sent,
             'uptime_seconds': uptime,
             # Convert timestamp to ISO format string, or None if not set
-            'last_sentence_time': time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(self.last_sentence_time)) if self.last_sentence_time else None,
+            'last_sentence_time': self._format_last_sentence_time() if self.last_sentence_time else None,
             'sentences_per_second': self.sentences_sent / max(1, uptime) if uptime > 0 else 0
         }
     
+    def _format_last_sentence_time(self) -> str:
+        """Format last_sentence_time as ISO 8601, reformatting once per second."""
+        second = int(self.last_sentence_time)
+        if second != self._cached_iso[0]:
+            self._cached_iso = (second, time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(second)))
+        return self._cached_iso[1]
+    
     def reset_stats(self) -> None:
         """Reset statistics."""
         self.sentences_sent = 0
         current_time = time.time()
         self.start_time = current_time
         self.last_sentence_time = current_time
+        self._start_monotonic = time.monotonic()
     
     def __enter__(self):
         """Context manager entry."""
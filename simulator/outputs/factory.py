@@ -1,6 +1,6 @@
 """Factory for creating output handlers from configuration."""
 
-from typing import List
+from typing import Dict, List, Type
 from .base import OutputHandler
 from .file import FileOutput
 from .tcp import TCPOutput
@@ -12,22 +12,35 @@ from ..config.parser import OutputConfig
 class OutputFactory:
     """Factory for creating output handlers."""
     
-    @staticmethod
-    def create_output_handler(output_config: OutputConfig) -> OutputHandler:
+    # Output type name -> handler class constructed from the parsed config object
+    _REGISTRY: Dict[str, Type[OutputHandler]] = {
+        'file': FileOutput,
+        'tcp': TCPOutput,
+        'udp': UDPOutput,
+        'serial': SerialOutput,
+    }
+    
+    @classmethod
+    def register_output_type(cls, name: str, handler_class: Type[OutputHandler]) -> None:
+        """Register (or replace) the handler class used for an output type.
+
+        Type names are case-insensitive. ConfigParser only builds configs for
+        the built-in types and rejects any other type name, so a registered
+        type is reached through an OutputConfig constructed in code, whose
+        config object is passed unchanged to handler_class.
+        """
+        cls._REGISTRY[name.lower()] = handler_class
+    
+    @classmethod
+    def create_output_handler(cls, output_config: OutputConfig) -> OutputHandler:
         """Create output handler from configuration."""
         if not output_config.enabled:
             raise ValueError("Output handler is disabled")
         
-        if output_config.type == 'file':
-            return FileOutput(output_config.config)
-        elif output_config.type == 'tcp':
-            return TCPOutput(output_config.config)
-        elif output_config.type == 'udp':
-            return UDPOutput(output_config.config)
-        elif output_config.type == 'serial': # Added serial type
-            return SerialOutput(output_config.config)
-        else:
+        handler_class = cls._REGISTRY.get(output_config.type.lower())
+        if handler_class is None:
             raise ValueError(f"Unknown output type: {output_config.type}")
+        return handler_class(output_config.config)
     
     @staticmethod
     def create_output_handlers(output_configs: List[OutputConfig]) -> List[OutputHandler]:
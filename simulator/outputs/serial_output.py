@@ -1,10 +1,27 @@
 """Serial output handler for NMEA sentences."""
 
+from collections import deque # For the bounded recent-send history
+import functools # For caching generated send_sentence factories
+import io
+import logging
+import os # For writing directly to the port's file descriptor
+import queue # For handing encoded sentences to the writer thread
+import random # For reconnect backoff jitter
+import select # For waiting on a full kernel transmit buffer
+import time # For reconnect delays and send intervals
+import threading # For reconnection logic and the writer thread
+import weakref # For closing an abandoned handler's port without __del__
 from dataclasses import dataclass, field
-from typing import Optional # Added Optional
+from typing import Optional
+
 import serial
 
-@dataclass
+from .base import OutputHandler
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
 class SerialOutputConfig:
     """Configuration for Serial output."""
 
@@ -21,9 +38,14 @@ class SerialOutputConfig:
     xonxoff: bool = False
     exclusive: bool = True # Exclusive access to the port
     send_interval: float = 0.1 # Minimum interval between sends, in seconds
-    reconnect_delay: float = 5.0 # Delay before attempting to reconnect, in seconds
+    reconnect_delay: float = 5.0 # Base delay before attempting to reconnect, in seconds
+    max_reconnect_delay: float = 60.0 # Cap on the exponential reconnect backoff, in seconds
     max_reconnect_attempts: int = 5 # Maximum number of reconnect attempts (-1 for infinite)
     line_ending: str = "\r\n" # Characters to append to each sentence
+    tx_queue_size: int = 1024 # Maximum number of sentences waiting for the writer thread
+    max_batch_size: int = 64 # Maximum number of sentences coalesced into one write
+    coalesce_delay_ms: float = 0.0 # Wait this long after the first queued sentence for more to batch (0 disables)
+    single_producer: bool = False # Only one thread calls send_sentence(); enables the lock-free ring buffer
 
     # Fields for pyserial-specific settings that might not be common
     # These are advanced settings and might not be needed for basic operation
@@ -40,6 +62,14 @@ class SerialOutputConfig:
             raise ValueError("Timeout cannot be negative.")
         if self.write_timeout is not None and self.write_timeout < 0:
             raise ValueError("Write timeout cannot be negative.")
+        if self.tx_queue_size <= 0:
+            raise ValueError("Transmit queue size must be a positive integer.")
+        if self.reconnect_delay < 0 or self.max_reconnect_delay < 0:
+            raise ValueError("Reconnect delays cannot be negative.")
+        if self.max_batch_size <= 0:
+            raise ValueError("Maximum batch size must be a positive integer.")
+        if self.coalesce_delay_ms < 0:
+            raise ValueError("Coalesce delay cannot be negative.")
 
         # Convert string representations of serial settings to their pyserial equivalents
         # This allows configuration from YAML/JSON using strings like "EIGHTBITS", "PARITY_ODD", etc.
@@ -75,22 +105,169 @@ class SerialOutputConfig:
             # **self.serial_kwargs # If using advanced settings
         }
 
-from .base import OutputHandler
-import time # For reconnect delays and send intervals
-import threading # For reconnection logic
+
+# writev() rejects more buffers than the platform's IOV_MAX
+try:
+    _IOV_MAX = os.sysconf('SC_IOV_MAX')
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = 1024
+if _IOV_MAX <= 0:
+    _IOV_MAX = 1024
+
+# Independent RNG (seeded from OS entropy) so instances sharing a failure do not retry in lockstep
+_backoff_rng = random.Random()
+
+class SpscRingBuffer:
+    """Fixed-capacity single-producer/single-consumer ring buffer.
+
+    Exactly one thread may call put_nowait() and exactly one other thread may
+    call get()/get_nowait(). Each index is only written by its own side, so no
+    lock is taken on the steady-state path. Implements the subset of the
+    queue.Queue interface used by SerialOutput.
+    """
+
+    def __init__(self, capacity: int):
+        size = 1
+        while size < capacity:
+            size <<= 1
+        self._buffer: list = [None] * size
+        self._mask = size - 1
+        self._head = 0 # Next slot to write (producer only)
+        self._tail = 0 # Next slot to read (consumer only)
+        self._not_empty = threading.Event()
+
+    def put_nowait(self, item) -> None:
+        head = self._head
+        if head - self._tail > self._mask:
+            raise queue.Full
+        self._buffer[head & self._mask] = item
+        self._head = head + 1
+        if not self._not_empty.is_set():
+            self._not_empty.set()
+
+    def get_nowait(self):
+        tail = self._tail
+        if tail == self._head:
+            raise queue.Empty
+        index = tail & self._mask
+        item = self._buffer[index]
+        self._buffer[index] = None
+        self._tail = tail + 1
+        return item
+
+    def get(self, timeout: Optional[float] = None):
+        if self._tail == self._head:
+            self._not_empty.clear()
+            # Re-check after clearing so a put racing with clear() is not missed
+            if self._tail == self._head:
+                self._not_empty.wait(timeout)
+        return self.get_nowait()
+
+    def empty(self) -> bool:
+        return self._tail == self._head
+
+
+def _advance_buffers(buffers: list, written: int) -> list:
+    """Drops the first `written` bytes from a list of buffers after a short write."""
+    index = 0
+    while index < len(buffers) and written >= len(buffers[index]):
+        written -= len(buffers[index])
+        index += 1
+    remaining = buffers[index:]
+    if written:
+        remaining[0] = remaining[0][written:] # Only the partially written buffer is copied
+    return remaining
+
+
+def _release_abandoned_port(stop_event: threading.Event, serial_port) -> None:
+    """Stops the writer thread and closes the port of a handler garbage-collected without stop()."""
+    stop_event.set()
+    try:
+        serial_port.close()
+    except Exception:
+        pass
+
+
+def _run_writer(handler_ref: "weakref.ref[SerialOutput]", stop_event: threading.Event) -> None:
+    """Writer thread body for SerialOutput.
+
+    The handler is only referenced weakly while waiting for sentences, so a
+    handler abandoned without stop() can still be garbage-collected; its
+    finalizer then sets stop_event, which ends this loop.
+    """
+    batch: list = [] # Reused across cycles rather than reallocated per batch
+    while not stop_event.is_set():
+        handler = handler_ref()
+        if handler is None:
+            return
+        tx_queue = handler._tx_queue # Re-read each cycle: start() swaps in a new queue
+        del handler
+        batch.clear()
+        try:
+            batch.append(tx_queue.get(timeout=0.1))
+        except queue.Empty:
+            continue
+        handler = handler_ref()
+        if handler is None:
+            return
+        handler._write_cycle(batch)
+        del handler
+
+    handler = handler_ref()
+    if handler is not None:
+        handler._drain_tx_queue()
+
+
+@functools.lru_cache(maxsize=None)
+def _send_sentence_factory(line_ending: bytes):
+    """Generate a send_sentence closure factory with line_ending baked in as a bytes constant.
+
+    Only a handful of line endings are ever configured, so each is compiled once.
+    """
+    source = (
+        "def _make_send_sentence(put, port):\n"
+        "    def send_sentence(sentence):\n"
+        "        try:\n"
+        f"            put(sentence.strip().encode('ascii') + {line_ending!r})\n"
+        "        except Full:\n"
+        "            return False\n"
+        "        except UnicodeEncodeError:\n"
+        "            logger.warning('Refusing to send non-ASCII sentence on %s: %r', port, sentence)\n"
+        "            return False\n"
+        "        return True\n"
+        "    return send_sentence\n"
+    )
+    namespace = {'Full': queue.Full, 'logger': logger}
+    exec(compile(source, f'<serial send_sentence {line_ending!r}>', 'exec'), namespace)
+    return namespace['_make_send_sentence']
+
 
 class SerialOutput(OutputHandler):
-    """Serial port output handler for NMEA sentences."""
+    """Serial port output handler for NMEA sentences.
+
+    send_sentence() only encodes and queues a sentence; a background writer
+    thread drains the queue and writes pending sentences to the port in
+    batches, at most one write per send_interval.
+    """
 
     def __init__(self, config: SerialOutputConfig):
         """Initialize Serial output handler."""
         super().__init__()
         self.config = config
         self.serial_port: Optional[serial.Serial] = None
+        self._fd: Optional[int] = None # Raw descriptor of serial_port, when the platform exposes one
+        self._port_finalizer: Optional[weakref.finalize] = None # Closes serial_port if the handler is collected
+        # True while serial_port is open; a plain attribute read instead of pyserial's is_open property
+        self._connected = False
         self._lock = threading.Lock()
         self._stop_event = threading.Event()
         self._reconnect_thread: Optional[threading.Thread] = None
+        self._writer_thread: Optional[threading.Thread] = None
+        self._tx_queue = self._new_tx_queue()
         self._last_send_time: float = 0.0
+        # (monotonic time, sentences_sent) after each recent successful write, for the recent send rate
+        self._send_history: deque = deque(maxlen=1024)
+        self._line_ending_bytes: bytes = config.line_ending.encode('ascii')
 
     def start(self) -> None:
         """Start the serial output handler."""
@@ -98,20 +275,29 @@ class SerialOutput(OutputHandler):
             return
 
         self._stop_event.clear()
-        print(f"Attempting to start serial output on {self.config.port} at {self.config.baudrate} baud.")
+        self._tx_queue = self._new_tx_queue() # Drop sentences left from a previous run
+        logger.info("Attempting to start serial output on %s at %s baud.", self.config.port, self.config.baudrate)
         try:
             self._connect()
             self.is_running = True
             self.start_time = time.time() # Record start time
-            print(f"Serial output started on {self.config.port}")
+            self._start_monotonic = time.monotonic()
+            self._start_writer_thread()
+            logger.info("Serial output started on %s", self.config.port)
         except serial.SerialException as e:
             self.is_running = False
-            print(f"Failed to open serial port {self.config.port}: {e}")
+            logger.error("Failed to open serial port %s: %s", self.config.port, e)
             # Optionally, start reconnection attempts if configured
             if self.config.max_reconnect_attempts != 0:
                  self._start_reconnect_thread()
             # raise RuntimeError(f"Failed to start serial output: {e}") # Or handle more gracefully
 
+    def _new_tx_queue(self):
+        """Creates the transmit queue shared with the writer thread."""
+        if self.config.single_producer:
+            return SpscRingBuffer(self.config.tx_queue_size)
+        return queue.Queue(maxsize=self.config.tx_queue_size)
+
     def _connect(self) -> None:
         """Establish serial connection."""
         if self.serial_port and self.serial_port.is_open:
@@ -121,102 +307,279 @@ class SerialOutput(OutputHandler):
             self.serial_port = serial.Serial(**self.config.get_serial_options())
             # Ensure DTR/RTS are set if not using hardware flow control, some devices need them.
             if not self.config.rtscts:
-                 self.serial_port.dtr = True
-                 self.serial_port.rts = True
-            print(f"Successfully connected to serial port {self.config.port}.")
+                try:
+                    self.serial_port.dtr = True
+                    self.serial_port.rts = True
+                except OSError:
+                    pass # Modem control lines unsupported (e.g. pseudo-terminals)
+            try:
+                self._fd = self.serial_port.fileno()
+            except (AttributeError, OSError, io.UnsupportedOperation):
+                self._fd = None # e.g. Windows backends; fall back to pyserial writes
+            self._track_port(self.serial_port)
+            self._bind_fast_send()
+            self._connected = True
+            logger.info("Successfully connected to serial port %s.", self.config.port)
         except serial.SerialException as e:
-            print(f"Error connecting to {self.config.port}: {e}")
+            logger.warning("Error connecting to %s: %s", self.config.port, e)
             if self.serial_port:
                 self.serial_port.close()
             self.serial_port = None
+            self._fd = None
+            self._connected = False
+            self._unbind_fast_send()
             raise # Re-raise to be caught by start() or _reconnect_loop()
 
     def stop(self) -> None:
         """Stop the serial output handler."""
-        if not self.is_running and not (self._reconnect_thread and self._reconnect_thread.is_alive()):
+        if not self.is_running and not (self._reconnect_thread and self._reconnect_thread.is_alive()) \
+                and not (self._writer_thread and self._writer_thread.is_alive()):
             return
 
-        print(f"Stopping serial output on {self.config.port}...")
+        logger.info("Stopping serial output on %s...", self.config.port)
+        # Route new sentences through the checking send_sentence, which refuses them
+        # once stopping, so the writer's final drain below sees a closed queue.
+        self._unbind_fast_send()
         self._stop_event.set()
 
+        if self._writer_thread and self._writer_thread.is_alive():
+            # The writer drains what is still queued before exiting, bounded by write_timeout
+            write_timeout = self.config.write_timeout
+            self._writer_thread.join(
+                timeout=None if write_timeout is None else self.config.send_interval + 2 * write_timeout + 1)
+        if not (self._writer_thread and self._writer_thread.is_alive()):
+            # Writer gone (or never started): sweep up anything queued after its last check
+            self._drain_tx_queue()
+        self._writer_thread = None
+
         if self._reconnect_thread and self._reconnect_thread.is_alive():
             self._reconnect_thread.join(timeout=self.config.reconnect_delay + 1)
             self._reconnect_thread = None
 
         with self._lock:
+            self._connected = False
+            self._unbind_fast_send()
+            self._track_port(None)
             if self.serial_port and self.serial_port.is_open:
                 try:
+                    self.serial_port.flush() # Drain anything still in the kernel buffer
                     self.serial_port.close()
-                    print(f"Serial port {self.config.port} closed.")
+                    logger.info("Serial port %s closed.", self.config.port)
                 except Exception as e:
-                    print(f"Error closing serial port {self.config.port}: {e}")
+                    logger.error("Error closing serial port %s: %s", self.config.port, e)
             self.serial_port = None
+            self._fd = None
 
         self.is_running = False
-        print("Serial output stopped.")
+        logger.info("Serial output stopped.")
 
     def send_sentence(self, sentence: str) -> bool:
-        """Send NMEA sentence to the serial port."""
-        if not self.is_running or not self.serial_port or not self.serial_port.is_open:
+        """Queue NMEA sentence for the serial port writer thread.
+
+        Returns False if the port is not connected or the transmit queue is full.
+        """
+        if not self.is_running or not self._connected or self._stop_event.is_set():
             # If not running but trying to send, it could be due to a connection issue.
             # Reconnection logic will handle this if enabled.
             if not self.is_running and self.config.max_reconnect_attempts != 0 and not (self._reconnect_thread and self._reconnect_thread.is_alive()):
-                print("Serial port not connected. Attempting to reconnect...")
+                logger.warning("Serial port not connected. Attempting to reconnect...")
                 self._start_reconnect_thread() # Try to bring it back up
             return False
 
+        # Strip sentence then append configured line ending (NMEA 0183 is ASCII-only)
+        try:
+            payload = sentence.strip().encode('ascii') + self._line_ending_bytes
+        except UnicodeEncodeError:
+            logger.warning("Refusing to send non-ASCII sentence on %s: %r", self.config.port, sentence)
+            return False
+        try:
+            self._tx_queue.put_nowait(payload)
+        except queue.Full:
+            return False
+        return True
+
+    def _bind_fast_send(self) -> None:
+        """Shadows send_sentence with a closure specialised for the live connection.
+
+        The closure captures the transmit queue's put_nowait and has the encoded
+        line ending compiled in as a constant, skipping the connection checks and attribute lookups of the class
+        method. _unbind_fast_send() restores the class method on disconnect.
+        """
+        make_send_sentence = _send_sentence_factory(self._line_ending_bytes)
+        self.send_sentence = make_send_sentence(self._tx_queue.put_nowait, self.config.port)
+
+    def _unbind_fast_send(self) -> None:
+        """Falls back to the checking SerialOutput.send_sentence."""
+        self.__dict__.pop('send_sentence', None)
+
+    def _start_writer_thread(self) -> None:
+        """Starts the writer thread if not already running."""
+        if not self._writer_thread or not self._writer_thread.is_alive():
+            self._writer_thread = threading.Thread(
+                target=_run_writer, args=(weakref.ref(self), self._stop_event), daemon=True)
+            self._writer_thread.start()
+
+    def _write_cycle(self, batch: list) -> None:
+        """Completes a batch started with the first queued sentence and writes it.
+
+        Called by the writer thread (_run_writer). After stop() the sentences
+        still queued are written out before the thread exits (see
+        _drain_tx_queue), so none that send_sentence() accepted are dropped
+        while the port is up.
+        """
+        if self.config.coalesce_delay_ms > 0:
+            self._coalesce(batch)
+        try:
+            while len(batch) < self.config.max_batch_size:
+                batch.append(self._tx_queue.get_nowait())
+        except queue.Empty:
+            pass
+
+        # Enforce minimum interval between writes; producers keep queueing meanwhile.
+        # Waiting on the stop event instead of sleeping lets stop() cut the wait
+        # short; the batch in hand is then written and the rest drained afterwards.
+        wait_time = self.config.send_interval - (time.monotonic() - self._last_send_time)
+        if wait_time > 0:
+            self._stop_event.wait(wait_time)
+
+        error = self._send_batch(batch)
+        if error:
+            logger.error(*error)
+            self._handle_send_error()
+
+    def _send_batch(self, batch: list) -> Optional[tuple]:
+        """Writes one batch and records it; returns a (format, args...) log tuple on failure."""
         with self._lock:
-            if not self.serial_port or not self.serial_port.is_open:
-                return False # Should be caught by the check above, but as a safeguard
-
-            # Enforce minimum send interval
-            current_time = time.time()
-            if current_time - self._last_send_time < self.config.send_interval:
-                time.sleep(self.config.send_interval - (current_time - self._last_send_time))
+            if not self._connected:
+                return None # Connection lost; the batch is dropped
 
             try:
-                # Strip sentence then append configured line ending
-                full_sentence = sentence.strip() + self.config.line_ending
-                self.serial_port.write(full_sentence.encode('utf-8'))
-                self.serial_port.flush() # Ensure data is sent
-                self.sentences_sent += 1
+                # write() only hands bytes to the kernel buffer (bounded by write_timeout);
+                # flush() blocks until the UART has sent them, so only do it once idle.
+                self._write_batch(batch)
+                if self._tx_queue.empty():
+                    self.serial_port.flush()
+                self.sentences_sent += len(batch)
                 self.last_sentence_time = time.time() # Record time of last successful send
-                self._last_send_time = time.time()
-                return True
+                self._last_send_time = time.monotonic()
+                self._send_history.append((self._last_send_time, self.sentences_sent))
             except serial.SerialTimeoutException as e:
-                print(f"Serial write timeout on {self.config.port}: {e}")
-                self._handle_send_error()
-                return False
+                return ("Serial write timeout on %s: %s", self.config.port, e)
             except serial.SerialException as e:
-                print(f"Serial error on {self.config.port} during send: {e}")
-                self._handle_send_error()
-                return False
+                return ("Serial error on %s during send: %s", self.config.port, e)
             except Exception as e:
-                print(f"Unexpected error sending data on {self.config.port}: {e}")
-                self._handle_send_error()
-                return False
+                return ("Unexpected error sending data on %s: %s", self.config.port, e)
+        return None
+
+    def _drain_tx_queue(self) -> None:
+        """Writes the sentences still queued when stopping, without the send interval.
+
+        Runs on the consumer side of the queue: in the writer thread, or in
+        stop() once the writer has exited. Gives up after write_timeout overall
+        or on the first write error, since the port is being closed anyway.
+        """
+        write_timeout = self.config.write_timeout
+        deadline = None if write_timeout is None else time.monotonic() + write_timeout
+        batch: list = []
+        while not self._tx_queue.empty():
+            if deadline is not None and time.monotonic() >= deadline:
+                logger.warning("Dropping sentences still queued for %s after write timeout.", self.config.port)
+                return
+            batch.clear()
+            try:
+                while len(batch) < self.config.max_batch_size:
+                    batch.append(self._tx_queue.get_nowait())
+            except queue.Empty:
+                pass
+            error = self._send_batch(batch)
+            if error:
+                logger.error(*error)
+                return
+            if not self._connected:
+                return
+
+    def _coalesce(self, batch: list) -> None:
+        """Waits up to coalesce_delay_ms for further sentences to join the batch.
+
+        Serial analogue of Nagle's algorithm: a burst trickling in from a fast
+        producer goes out as one write instead of several short ones.
+        """
+        deadline = time.monotonic() + self.config.coalesce_delay_ms / 1000.0
+        while len(batch) < self.config.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            try:
+                batch.append(self._tx_queue.get(timeout=remaining))
+            except queue.Empty:
+                return
+
+    def _write_batch(self, batch: list) -> None:
+        """Writes a batch of encoded sentences to the port.
+
+        On the raw descriptor path the sentences go out with one gather write
+        (writev) instead of being joined first; pyserial takes a single
+        buffer, so the batch is joined for that path.
+        """
+        if self._fd is None:
+            self.serial_port.write(b"".join(batch))
+            return
+
+        pending = batch
+        unwritten = sum(map(len, pending))
+        write_timeout = self.config.write_timeout
+        deadline = None if write_timeout is None else time.monotonic() + write_timeout
+        while True:
+            try:
+                if len(pending) <= _IOV_MAX:
+                    written = os.writev(self._fd, pending)
+                else:
+                    written = os.writev(self._fd, pending[:_IOV_MAX])
+            except BlockingIOError:
+                written = 0 # Kernel buffer full (pyserial opens the port non-blocking)
+            unwritten -= written
+            if not unwritten:
+                return # Common case: everything went out in one call, nothing to re-slice
+            pending = _advance_buffers(pending, written) # Never mutates the caller's batch list
+
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                raise serial.SerialTimeoutException("Write timeout")
+            select.select([], [self._fd], [], remaining)
 
     def _handle_send_error(self):
         """Handles errors during sending, potentially triggering reconnection."""
         self.is_running = False # Mark as not running to stop further sends until reconnected
+        self._connected = False
+        self._unbind_fast_send()
+        self._track_port(None)
         if self.serial_port:
             try:
                 self.serial_port.close()
             except Exception:
                 pass # Ignore errors during close if already in error state
         self.serial_port = None
+        self._fd = None
 
         if not self._stop_event.is_set() and self.config.max_reconnect_attempts != 0:
-            print("Connection lost. Attempting to reconnect...")
+            logger.warning("Connection lost. Attempting to reconnect...")
             self._start_reconnect_thread()
 
+    def _track_port(self, serial_port: Optional[serial.Serial]) -> None:
+        """Registers serial_port to be closed, and the writer stopped, if this handler is garbage-collected while it is open."""
+        if self._port_finalizer is not None:
+            self._port_finalizer.detach()
+            self._port_finalizer = None
+        if serial_port is not None:
+            self._port_finalizer = weakref.finalize(self, _release_abandoned_port, self._stop_event, serial_port)
+
     def _start_reconnect_thread(self):
         """Starts the reconnection thread if not already running."""
         with self._lock: # Protect access to _reconnect_thread
             if not self._reconnect_thread or not self._reconnect_thread.is_alive():
                 self._reconnect_thread = threading.Thread(target=self._reconnect_loop, daemon=True)
                 self._reconnect_thread.start()
-                print("Reconnection thread started.")
+                logger.debug("Reconnection thread started.")
 
     def _reconnect_loop(self) -> None:
         """Periodically attempts to reconnect to the serial port."""
@@ -230,56 +593,69 @@ class SerialOutput(OutputHandler):
                 break
 
             attempts += 1
-            print(f"Reconnection attempt {attempts}/{max_attempts if max_attempts != -1 else 'infinite'} for {self.config.port}...")
+            logger.info("Reconnection attempt %d/%s for %s...", attempts,
+                        max_attempts if max_attempts != -1 else 'infinite', self.config.port)
 
             try:
                 with self._lock: # Ensure exclusive access for connection attempt
                     self._connect() # Try to connect
                     self.is_running = True # If connect succeeds
                     self.start_time = time.time()
-                    print(f"Successfully reconnected to {self.config.port}.")
+                    self._start_monotonic = time.monotonic()
+                    logger.info("Successfully reconnected to %s.", self.config.port)
+                self._start_writer_thread()
                 # If successful, break the loop
                 break
             except serial.SerialException as e:
-                print(f"Reconnect attempt {attempts} failed: {e}")
-                # Wait for the configured delay or until stop_event is set
-                self._stop_event.wait(self.config.reconnect_delay)
+                logger.warning("Reconnect attempt %d failed: %s", attempts, e)
+                # Wait for the backoff delay or until stop_event is set
+                self._stop_event.wait(self._reconnect_backoff(attempts))
             except Exception as e: # Catch any other unexpected errors during connect
-                print(f"Unexpected error during reconnect attempt {attempts}: {e}")
-                self._stop_event.wait(self.config.reconnect_delay)
+                logger.error("Unexpected error during reconnect attempt %d: %s", attempts, e)
+                self._stop_event.wait(self._reconnect_backoff(attempts))
 
         if not self.is_running and not self._stop_event.is_set():
-            print(f"Failed to reconnect to {self.config.port} after {attempts} attempts. Stopping reconnection attempts.")
+            logger.error("Failed to reconnect to %s after %d attempts. Stopping reconnection attempts.", self.config.port, attempts)
         elif self._stop_event.is_set():
-             print("Reconnection attempts stopped by stop event.")
+             logger.info("Reconnection attempts stopped by stop event.")
 
         # Clean up the thread reference once done, if it was this thread
         with self._lock:
             if self._reconnect_thread == threading.current_thread():
                  self._reconnect_thread = None
-                 print("Reconnection thread finished.")
+                 logger.debug("Reconnection thread finished.")
+
 
+    def _reconnect_backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff delay after the given failed attempt (1-based)."""
+        ceiling = min(self.config.reconnect_delay * (2 ** min(attempt - 1, 6)),
+                      self.config.max_reconnect_delay)
+        return _backoff_rng.uniform(0, ceiling)
 
     def get_status(self) -> dict:
         """Get serial output status."""
         status = super().get_status()
+        status['port'] = self.config.port
+        status['baudrate'] = self.config.baudrate
         with self._lock:
             status.update({
-                'port': self.config.port,
-                'baudrate': self.config.baudrate,
                 'is_open': self.serial_port.is_open if self.serial_port else False,
                 'reconnecting': self._reconnect_thread.is_alive() if self._reconnect_thread else False,
+                'recent_sentences_per_second': self._recent_send_rate(),
             })
         return status
 
+    def _recent_send_rate(self) -> float:
+        """Sentences per second over the writes kept in the bounded send history."""
+        if len(self._send_history) < 2:
+            return 0.0
+        first_time, first_count = self._send_history[0]
+        last_time, last_count = self._send_history[-1]
+        return (last_count - first_count) / max(1e-6, last_time - first_time)
+
     def __str__(self) -> str:
         """String representation."""
         state = "RUNNING" if self.is_running else "STOPPED"
         if not self.is_running and self._reconnect_thread and self._reconnect_thread.is_alive():
             state = "RECONNECTING"
-        details = f"{self.config.port}@{self.config.baudrate}bps"
-        return f"SerialOutput({state}, {details}, {self.sentences_sent} sentences)"
-
-    def __del__(self):
-        """Ensure resources are released."""
-        self.stop()
+        return f"SerialOutput({state}, {self.config.port}@{self.config.baudrate}bps, {self.sentences_sent} sentences)"
@@ -1,11 +1,17 @@
 """Unit tests for NMEA library core functionality."""
 
 import unittest
+
+import numpy as np
+
 from nmea_lib import (
     SentenceValidator, SentenceParser, SentenceFactory,
     GGASentence, RMCSentence, TalkerId, SentenceId,
     Position, NMEATime, NMEADate, Speed, SpeedUnit
 )
+from nmea_lib.ais.constants import NavigationStatus
+from nmea_lib.base import GpsFixQuality
+from nmea_lib.types import Distance, DistanceUnit, VesselFleet, create_vessel_state
 
 
 class TestSentenceValidator(unittest.TestCase):
@@ -100,6 +106,45 @@ class TestGGASentence(unittest.TestCase):
         sentence_str = sentence.to_sentence()
         self.assertTrue(sentence_str.startswith("$GPGGA"))
         self.assertTrue(SentenceValidator.is_valid(sentence_str))
+    
+    def test_setters_invalidate_cached_sentence_tail(self):
+        """Test that changing any field after the time is reflected in the next sentence."""
+        updates = [
+            ('set_position', (59.5, 24.75)),
+            ('set_fix_quality', (GpsFixQuality.DGPS,)),
+            ('set_satellites_in_use', (11,)),
+            ('set_horizontal_dilution', (0.9,)),
+            ('set_altitude', (Distance(42.5, DistanceUnit.METERS),)),
+            ('set_geoidal_height', (Distance(17.0, DistanceUnit.METERS),)),
+            ('set_dgps_age', (3.0,)),
+            ('set_dgps_station_id', ("0120",)),
+        ]
+        initial = [
+            ('set_time', ("120044",)),
+            ('set_position', (60.19253333, 25.03235)),
+            ('set_fix_quality', (GpsFixQuality.GPS,)),
+            ('set_satellites_in_use', (8,)),
+            ('set_horizontal_dilution', (2.0,)),
+            ('set_altitude', (Distance(28.0, DistanceUnit.METERS),)),
+            ('set_geoidal_height', (Distance(19.6, DistanceUnit.METERS),)),
+        ]
+        for setter, args in updates:
+            with self.subTest(setter=setter):
+                cached = GGASentence()
+                fresh = GGASentence()
+                for name, init_args in initial:
+                    getattr(cached, name)(*init_args)
+                    getattr(fresh, name)(*init_args)
+                before = cached.to_sentence() # Fills the tail cache
+                
+                getattr(cached, setter)(*args)
+                getattr(fresh, setter)(*args)
+                cached.set_time("120045")
+                fresh.set_time("120045")
+                
+                self.assertNotEqual(cached.to_sentence(), before)
+                self.assertEqual(cached.to_sentence(), fresh.to_sentence())
+                self.assertTrue(SentenceValidator.is_valid(cached.to_sentence()))
 
 
 class TestRMCSentence(unittest.TestCase):
@@ -162,6 +207,21 @@ class TestPosition(unittest.TestCase):
         # Approximately 111 km for 1 degree latitude
         self.assertGreater(distance, 100000)
         self.assertLess(distance, 120000)
+    
+    def test_batched_distance_calculation(self):
+        """Test vectorized distances against the scalar calculation."""
+        rng = np.random.default_rng(0)
+        lats = rng.uniform(-60, 60, 10000)
+        lons = rng.uniform(-180, 180, 10000)
+        
+        distances = Position.distance_to_many(lats, lons, lats + 1, lons)
+        # Approximately 111 km for 1 degree latitude
+        self.assertTrue((distances > 100000).all())
+        self.assertTrue((distances < 120000).all())
+        
+        for i in rng.choice(len(lats), 100, replace=False):
+            expected = Position(lats[i], lons[i]).distance_to(Position(lats[i] + 1, lons[i]))
+            self.assertAlmostEqual(distances[i], expected, places=6)
 
 
 class TestNMEATime(unittest.TestCase):
@@ -184,6 +244,52 @@ class TestNMEATime(unittest.TestCase):
         self.assertEqual(time_obj.to_nmea(include_fractional=False), "120044")
 
 
+class TestVesselFleet(unittest.TestCase):
+    """Test array-backed fleet navigation data."""
+    
+    def test_advance_matches_position_move(self):
+        """Test bulk advance against per-vessel great-circle moves."""
+        states = [
+            create_vessel_state(123456789, "ALPHA", Position(60.0, 25.0), sog=12.0, cog=45.0),
+            create_vessel_state(987654321, "BRAVO", Position(-33.9, 151.2), sog=8.5, cog=270.0),
+        ]
+        fleet = VesselFleet.from_states(states)
+        fleet.advance(60.0)
+        
+        for state in states:
+            nav = state.navigation_data
+            expected = nav.position.move_by_bearing_distance(nav.cog, nav.sog * 0.514444 * 60.0)
+            view = fleet.view(state.mmsi)
+            self.assertAlmostEqual(view.position.latitude, expected.latitude, places=9)
+            self.assertAlmostEqual(view.position.longitude, expected.longitude, places=9)
+            self.assertEqual(view.sog, nav.sog)
+            self.assertEqual(view.nav_status, nav.nav_status)
+    
+    def test_advance_wraps_longitude_at_antimeridian(self):
+        """Test that vessels crossing 180° come out on the other side."""
+        states = [
+            create_vessel_state(123456789, "EAST", Position(0.0, 179.99), sog=20.0, cog=90.0),
+            create_vessel_state(987654321, "WEST", Position(0.0, -179.99), sog=20.0, cog=270.0),
+        ]
+        fleet = VesselFleet.from_states(states)
+        fleet.advance(3600.0)
+        
+        # 20 kn for an hour along the equator is 20 arc minutes
+        step = 20 * 1852.0 / 6371000 * 180 / np.pi
+        self.assertAlmostEqual(fleet.view(123456789).position.longitude, 179.99 + step - 360.0, places=6)
+        self.assertAlmostEqual(fleet.view(987654321).position.longitude, -179.99 - step + 360.0, places=6)
+    
+    def test_view_round_trips_navigation_data(self):
+        """Test that view() returns every field stored by update()."""
+        state = create_vessel_state(
+            123456789, "ALPHA", Position(60.0, 25.0), sog=12.0, cog=45.0, heading=44,
+            nav_status=NavigationStatus.AT_ANCHOR, rot=-5, timestamp=30,
+            position_accuracy=1, raim=1, radio_status=12345,
+        )
+        fleet = VesselFleet.from_states([state])
+        self.assertEqual(fleet.view(state.mmsi), state.navigation_data)
+
+
 if __name__ == '__main__':
     unittest.main()
 
@@ -0,0 +1,62 @@
+"""Tests for the output handler factory."""
+
+import pytest
+
+from simulator.config.parser import ConfigParser, OutputConfig
+from simulator.outputs.base import OutputHandler
+from simulator.outputs.factory import OutputFactory
+
+
+class _ListOutput(OutputHandler):
+    """Output handler that collects sentences in a list."""
+
+    def __init__(self, config):
+        super().__init__()
+        self.config = config
+        self.sentences = []
+
+    def start(self) -> None:
+        self.is_running = True
+
+    def stop(self) -> None:
+        self.is_running = False
+
+    def send_sentence(self, sentence: str) -> bool:
+        self.sentences.append(sentence)
+        return True
+
+
+@pytest.fixture
+def list_output_type():
+    """Registers _ListOutput as the 'List' output type for one test."""
+    registry = dict(OutputFactory._REGISTRY)
+    OutputFactory.register_output_type('List', _ListOutput)
+    yield
+    OutputFactory._REGISTRY = registry
+
+
+def test_registered_type_creates_handler(list_output_type):
+    """Test that a registered type builds its handler from a hand-built OutputConfig."""
+    settings = {'capacity': 10}
+    for type_name in ('list', 'LIST'):
+        handler = OutputFactory.create_output_handler(OutputConfig(type=type_name, config=settings))
+        assert isinstance(handler, _ListOutput)
+        assert handler.config is settings
+
+
+def test_registered_type_in_create_output_handlers(list_output_type):
+    """Test that create_output_handlers builds registered types alongside built-in ones."""
+    handlers = OutputFactory.create_output_handlers([
+        OutputConfig(type='list', config=None),
+        OutputConfig(type='list', enabled=False, config=None),
+    ])
+    assert len(handlers) == 1
+    assert isinstance(handlers[0], _ListOutput)
+
+
+def test_unknown_type_is_rejected():
+    """Test that unregistered types raise ValueError in the factory and in ConfigParser."""
+    with pytest.raises(ValueError, match="Unknown output type"):
+        OutputFactory.create_output_handler(OutputConfig(type='carrier-pigeon', config=None))
+    with pytest.raises(ValueError, match="Unknown output type"):
+        ConfigParser._parse_output_config({'type': 'carrier-pigeon'})
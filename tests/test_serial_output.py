@@ -1,19 +1,27 @@
 """Tests for the SerialOutput handler."""
 
+import gc
 import pytest
+import queue
 import time
 import os
+import select
+import selectors
+import threading
+import weakref
 import pty # For creating virtual serial ports (Unix-like specific)
 import serial # For reading from the virtual serial port
 
-from simulator.outputs.serial_output import SerialOutput, SerialOutputConfig
+from simulator.outputs.serial_output import (
+    SerialOutput, SerialOutputConfig, SpscRingBuffer, _advance_buffers
+)
 from simulator.outputs.factory import OutputFactory
 from simulator.config.parser import ConfigParser, OutputConfig
 
 
-@pytest.fixture
-def virtual_serial_ports(scope="function"):
-    """Creates a virtual serial port pair using pty."""
+@pytest.fixture(scope="module")
+def virtual_serial_ports():
+    """Creates a virtual serial port pair using pty, shared by the tests in this module."""
     master_fd, slave_fd = pty.openpty()
     slave_name = os.ttyname(slave_fd)
 
@@ -35,21 +43,41 @@ def virtual_serial_ports(scope="function"):
     print("Virtual serial ports closed.")
 
 
+def _drain(fd):
+    """Discard anything a previous test left unread on the shared pty master."""
+    while select.select([fd], [], [], 0)[0]:
+        os.read(fd, 4096)
+
+
 @pytest.mark.skipif(not hasattr(pty, "openpty"), reason="pty module not available on this system (e.g., Windows)")
 class TestSerialOutput:
 
     def test_serial_output_initialization(self, virtual_serial_ports):
         """Test basic initialization of SerialOutput."""
-        slave_name, _ = virtual_serial_ports
+        slave_name, master_fd = virtual_serial_ports
+        _drain(master_fd)
         config = SerialOutputConfig(port=slave_name, baudrate=9600, timeout=0.1, write_timeout=0.1)
         handler = SerialOutput(config)
         assert handler.config.port == slave_name
         assert not handler.is_running
         assert handler.serial_port is None
 
+    def test_serial_options_follow_config_changes(self, virtual_serial_ports):
+        """Test that pyserial options and __str__ reflect settings changed after construction."""
+        slave_name, _ = virtual_serial_ports
+        config = SerialOutputConfig(port="/dev/null", baudrate=9600)
+        handler = SerialOutput(config)
+        config.port = slave_name
+        config.baudrate = 19200
+        options = config.get_serial_options()
+        assert options["port"] == slave_name
+        assert options["baudrate"] == 19200
+        assert f"{slave_name}@19200bps" in str(handler)
+
     def test_serial_output_start_stop(self, virtual_serial_ports):
         """Test starting and stopping SerialOutput."""
-        slave_name, _ = virtual_serial_ports
+        slave_name, master_fd = virtual_serial_ports
+        _drain(master_fd)
         config = SerialOutputConfig(port=slave_name, baudrate=9600, timeout=0.1, write_timeout=0.1, max_reconnect_attempts=0)
         handler = SerialOutput(config)
 
@@ -72,6 +100,7 @@ class TestSerialOutput:
     def test_serial_output_send_sentence(self, virtual_serial_ports):
         """Test sending a sentence over SerialOutput."""
         slave_name, master_fd = virtual_serial_ports
+        _drain(master_fd)
         config = SerialOutputConfig(
             port=slave_name,
             baudrate=9600,
@@ -89,52 +118,119 @@ class TestSerialOutput:
 
             sent = handler.send_sentence(test_sentence)
             assert sent, "send_sentence should return True on success"
-            assert handler.sentences_sent == 1
-
-            # Read from the master end of the pty
-            # This needs to be robust. The data might not arrive instantaneously.
-            # Set a timeout for the read operation.
-
-            # Create a serial object to read from the master_fd with appropriate settings
-            # This is a bit of a hack, as master_fd is not a typical serial device path.
-            # A more direct os.read might be better but can block.
-            # For pty, direct os.read is the way.
-
-            # Give some time for data to be written and available
-            time.sleep(0.2) # Increased sleep
-
-            # Read with a timeout (select can be used for non-blocking read with timeout on fd)
-            # For simplicity, let's try a direct read with a small buffer.
-            # This might be flaky if timing is off.
-            try:
-                # os.set_blocking(master_fd, False) # This might be needed
-                # Ensure master_fd is non-blocking for the read attempt to avoid hangs
-                # flags = fcntl.fcntl(master_fd, fcntl.F_GETFL)
-                # fcntl.fcntl(master_fd, fcntl.F_SETFL, flags | os.O_NONBLOCK)
-                # This can be problematic as it changes global state of fd.
-                # A better approach is using select.select() to check for readability.
-                # For now, a simple read with a small timeout via select would be ideal,
-                # but os.read() itself doesn't directly support a timeout.
-                # We'll rely on the short sleep and hope the data is there.
-
-                received_data_bytes = os.read(master_fd, 1024) # Read up to 1024 bytes
-                # The sentence is sent with config.line_ending, which is "\n" for this test.
-                # os.read will get "$GPGGA,test_data*CHECKSUM\n"
-                # .strip() will remove the trailing "\n"
-                received_data = received_data_bytes.decode('utf-8').strip()
-                print(f"Received on master: '{received_data_bytes.decode('utf-8')}' -> Stripped: '{received_data}'") # Debug print
-                assert received_data == test_sentence
-            except BlockingIOError:
-                pytest.fail("Read from master_fd blocked or no data received in non-blocking mode.")
-            except Exception as e:
-                pytest.fail(f"Error reading from master_fd: {e}")
 
+            # Wait for the master end of the pty to become readable instead of sleeping
+            # a fixed time; the read then happens as soon as the writer thread delivers.
+            with selectors.DefaultSelector() as sel:
+                sel.register(master_fd, selectors.EVENT_READ)
+                events = sel.select(timeout=0.5)
+            assert events, "No data received on the master end of the pty"
+
+            received_data_bytes = os.read(master_fd, 1024) # Read up to 1024 bytes
+            # The sentence is sent with config.line_ending, which is "\n" for this test.
+            received_data = received_data_bytes.rstrip(b'\n').decode('ascii')
+            assert received_data == test_sentence
+
+            # The writer counts the sentence while still holding the lock it wrote under
+            with handler._lock:
+                assert handler.sentences_sent == 1
+
+        finally:
+            handler.stop()
+
+    @pytest.mark.parametrize("count", [5, 300])
+    def test_serial_output_stop_writes_queued_sentences(self, virtual_serial_ports, count):
+        """Test that stop() writes every sentence send_sentence() accepted before stopping."""
+        slave_name, master_fd = virtual_serial_ports
+        _drain(master_fd)
+        config = SerialOutputConfig(
+            port=slave_name,
+            baudrate=9600,
+            timeout=0.1,
+            write_timeout=1.0,
+            line_ending="\n",
+            max_reconnect_attempts=0
+        )
+        handler = SerialOutput(config)
+        received = bytearray()
+
+        def read_lines():
+            # Keep the pty drained so the writer never blocks on a full buffer
+            with selectors.DefaultSelector() as sel:
+                sel.register(master_fd, selectors.EVENT_READ)
+                while received.count(b"\n") < count and sel.select(timeout=2.0):
+                    received.extend(os.read(master_fd, 4096))
+
+        reader = threading.Thread(target=read_lines, daemon=True)
+        reader.start()
+        try:
+            handler.start()
+            accepted = sum(handler.send_sentence(f"$GPTST,{i}*00") for i in range(count))
+        finally:
+            handler.stop()
+        reader.join(timeout=5)
+
+        assert accepted == count
+        assert handler.sentences_sent == count
+        assert received.decode('ascii').splitlines() == [f"$GPTST,{i}*00" for i in range(count)]
+
+    def test_abandoned_serial_output_is_released(self, virtual_serial_ports):
+        """Test that a started handler dropped without stop() is collected, closing its port."""
+        slave_name, master_fd = virtual_serial_ports
+        _drain(master_fd)
+        config = SerialOutputConfig(port=slave_name, baudrate=9600, timeout=0.1, write_timeout=0.1, max_reconnect_attempts=0)
+        handler = SerialOutput(config)
+        handler.start()
+        assert handler.is_running
+        port = handler.serial_port
+        writer_thread = handler._writer_thread
+        handler_ref = weakref.ref(handler)
+
+        del handler
+        gc.collect()
+
+        assert handler_ref() is None, "The writer thread must not keep the handler alive"
+        assert not port.is_open
+        writer_thread.join(timeout=1.0)
+        assert not writer_thread.is_alive()
+
+    def test_restart_after_send_error_writes_to_new_queue(self, virtual_serial_ports):
+        """Test that sentences sent after restarting from a send error reach the port."""
+        slave_name, master_fd = virtual_serial_ports
+        _drain(master_fd)
+        config = SerialOutputConfig(
+            port=slave_name,
+            baudrate=9600,
+            timeout=0.1,
+            write_timeout=0.1,
+            line_ending="\n",
+            max_reconnect_attempts=0
+        )
+        handler = SerialOutput(config)
+        try:
+            handler.start()
+            writer_thread = handler._writer_thread
+            handler._handle_send_error()
+            assert not handler.is_running
+
+            handler.start()
+            assert handler.is_running
+            assert handler._writer_thread is writer_thread, "The running writer thread is reused"
+            assert handler.send_sentence("$GPTST,restart*00")
+
+            with selectors.DefaultSelector() as sel:
+                sel.register(master_fd, selectors.EVENT_READ)
+                events = sel.select(timeout=1.0)
+            assert events, "Sentence queued after the restart was never written"
+            assert os.read(master_fd, 1024) == b"$GPTST,restart*00\n"
+            assert handler._tx_queue.empty()
         finally:
             handler.stop()
 
     def test_serial_config_parsing_and_factory(self, virtual_serial_ports):
         """Test parsing serial config and creating handler via factory."""
-        slave_name, _ = virtual_serial_ports
+        slave_name, master_fd = virtual_serial_ports
+        _drain(master_fd)
 
         # Minimal config data for serial
         raw_config_data = {
@@ -210,9 +306,8 @@ class TestSerialOutput:
 # The pty module creates a pseudo-terminal. The master end (master_fd) is what your test
 # uses to simulate the other side of the serial communication (e.g., a device reading NMEA data).
 # The slave end (identified by slave_name, e.g., /dev/pts/X) is what SerialOutput connects to.
-# Reading from master_fd can sometimes be tricky regarding blocking/non-blocking I/O and timing.
-# The current read in test_serial_output_send_sentence is basic and might need refinement
-# for robustness, e.g., using select.select for checking readability before os.read.
+# test_serial_output_send_sentence waits for master_fd to become readable with a selector
+# before os.read, so it neither blocks forever nor depends on a fixed sleep.
 #
 # For Windows, these tests relying on `pty` will be skipped. A different fixture
 # would be needed, potentially using a library like `com0com` (which requires prior setup)
@@ -243,4 +338,120 @@ def test_serial_output_start_failure_bad_port(capfd):
     # This is harder to reliably test without specific environment setup.
     # For now, focusing on non-existent and syntactically invalid.
 
-```
+
+class TestSpscRingBuffer:
+    """Tests for the single-producer/single-consumer transmit queue."""
+
+    def test_capacity_rounds_up_to_power_of_two(self):
+        """Test that capacity is rounded up to the next power of two."""
+        ring = SpscRingBuffer(5)
+        for i in range(8):
+            ring.put_nowait(i)
+        with pytest.raises(queue.Full):
+            ring.put_nowait(8)
+
+    def test_empty_and_full(self):
+        """Test empty/full detection and reuse of a freed slot."""
+        ring = SpscRingBuffer(4)
+        assert ring.empty()
+        with pytest.raises(queue.Empty):
+            ring.get_nowait()
+        for i in range(4):
+            ring.put_nowait(i)
+        assert not ring.empty()
+        with pytest.raises(queue.Full):
+            ring.put_nowait(4)
+        assert ring.get_nowait() == 0
+        ring.put_nowait(4) # One slot freed by the get
+        assert [ring.get_nowait() for _ in range(4)] == [1, 2, 3, 4]
+        assert ring.empty()
+
+    def test_wraparound_keeps_fifo_order(self):
+        """Test FIFO order while the indices wrap around the buffer."""
+        ring = SpscRingBuffer(4)
+        expected = []
+        received = []
+        # Interleave puts and gets so the indices wrap the 4-slot buffer many times
+        for i in range(50):
+            ring.put_nowait(i)
+            expected.append(i)
+            if i % 3 == 2:
+                while not ring.empty():
+                    received.append(ring.get_nowait())
+        while not ring.empty():
+            received.append(ring.get_nowait())
+        assert received == expected
+
+    def test_get_times_out_when_empty(self):
+        """Test that get() raises queue.Empty after its timeout."""
+        ring = SpscRingBuffer(4)
+        started = time.monotonic()
+        with pytest.raises(queue.Empty):
+            ring.get(timeout=0.05)
+        assert time.monotonic() - started >= 0.04
+
+    def test_concurrent_producer_and_consumer(self):
+        """Test one producer and one consumer thread passing items in order."""
+        ring = SpscRingBuffer(8)
+        count = 20000
+        received = []
+
+        def consume():
+            while len(received) < count:
+                try:
+                    received.append(ring.get(timeout=1.0))
+                except queue.Empty:
+                    return
+
+        consumer = threading.Thread(target=consume)
+        consumer.start()
+        for i in range(count):
+            while True:
+                try:
+                    ring.put_nowait(i)
+                    break
+                except queue.Full:
+                    time.sleep(0)
+        consumer.join(timeout=10)
+        assert received == list(range(count))
+
+
+class TestPartialWrites:
+    """Tests for resuming gather writes after a short write."""
+
+    BUFFERS = [b"abc", b"defg", b"hi"]
+
+    @pytest.mark.parametrize("written, expected", [
+        (0, [b"abc", b"defg", b"hi"]),
+        (2, [b"c", b"defg", b"hi"]),   # Inside the first buffer
+        (3, [b"defg", b"hi"]),         # Exactly on a boundary
+        (5, [b"fg", b"hi"]),           # Across one boundary, inside the next
+        (7, [b"hi"]),                  # Across two boundaries
+        (8, [b"i"]),
+        (9, []),                       # Everything written
+    ])
+    def test_advance_buffers(self, written, expected):
+        """Test dropping written bytes inside and across buffer boundaries."""
+        buffers = list(self.BUFFERS)
+        assert _advance_buffers(buffers, written) == expected
+        assert buffers == self.BUFFERS # The caller's list is left untouched
+
+    @pytest.mark.parametrize("chunk", [1, 2, 3, 4, 5])
+    def test_write_batch_resumes_short_writes(self, monkeypatch, chunk):
+        """Test that _write_batch delivers a batch intact when writev writes only part of it."""
+        read_fd, write_fd = os.pipe()
+        try:
+            handler = SerialOutput(SerialOutputConfig(port="/dev/null", write_timeout=1.0))
+            handler._fd = write_fd
+
+            def short_writev(fd, buffers):
+                # Write at most `chunk` bytes per call, like a nearly full kernel buffer
+                return os.write(fd, b"".join(buffers)[:chunk])
+
+            monkeypatch.setattr(os, "writev", short_writev)
+            handler._write_batch(list(self.BUFFERS))
+            assert os.read(read_fd, 64) == b"".join(self.BUFFERS)
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+
@@ -0,0 +1,124 @@
+"""Tests for the AIS trace logger."""
+
+import json
+import math
+import random
+from dataclasses import fields
+from datetime import datetime
+
+import pytest
+
+from simulator.core.trace_logger import (
+    TraceAnalyzer, TraceEntry, _EVENT_SCHEMAS, _freeze, _json_default, encode_trace_entry
+)
+
+
+# Sample values for every populated field, including non-ASCII text and
+# floats that json.dumps writes as NaN / Infinity
+_FIELD_SAMPLES = {
+    'message_type': 5,
+    'sentences': ["!AIVDM,1,1,,A,15M67FC000G?ufbE`FepT@3n00Sa,0*5C", "Ålesund → Göteborg"],
+    'input_data': _freeze({'name': 'MÖWE', 'sog': float('nan'), 'nested': {'eta': [1, 2]}}),
+    'processing_time_ms': float('inf'),
+    'data': _freeze({'course': -math.inf, 'note': 'quote " and backslash \\', 'empty': None}),
+    'errors': ["Ungültige Position", "tab\there"],
+}
+
+
+def _expected_json(entry: TraceEntry) -> str:
+    """Reference serialization with json.dumps."""
+    return json.dumps(
+        {f.name: getattr(entry, f.name) for f in fields(TraceEntry)},
+        separators=(',', ':'),
+        default=_json_default,
+    )
+
+
+@pytest.mark.parametrize("event_type", sorted(_EVENT_SCHEMAS))
+def test_generated_encoder_matches_json_dumps(event_type):
+    """Test each per-event encoder against json.dumps for the same entry."""
+    populated = _EVENT_SCHEMAS[event_type]
+    entry = TraceEntry(
+        timestamp=datetime(2024, 5, 17, 12, 30, 45, 123456).isoformat(),
+        event_type=event_type,
+        vessel_mmsi=123456789,
+        **{name: _FIELD_SAMPLES[name] for name in populated}
+    )
+    assert encode_trace_entry(entry) == _expected_json(entry)
+
+
+@pytest.mark.parametrize("event_type", sorted(_EVENT_SCHEMAS))
+def test_generated_encoder_with_empty_fields(event_type):
+    """Test each per-event encoder when its populated fields are left as None."""
+    entry = TraceEntry(timestamp=datetime(2024, 1, 1).isoformat(), event_type=event_type, vessel_mmsi=0)
+    assert encode_trace_entry(entry) == _expected_json(entry)
+
+
+def test_unknown_event_type_falls_back_to_json():
+    """Test that event types without a generated encoder still serialize."""
+    entry = TraceEntry(
+        timestamp=datetime(2024, 1, 1).isoformat(),
+        event_type='custom "event"',
+        vessel_mmsi=987654321,
+        data=_freeze({'value': float('nan')}),
+    )
+    assert encode_trace_entry(entry) == _expected_json(entry)
+
+
+def _reference_message_type_stats(entries):
+    """The per-entry dict loop get_message_type_stats replaced."""
+    stats = {}
+    for entry in entries:
+        if entry.message_type and entry.event_type == 'message_generated':
+            msg_type = entry.message_type
+            if msg_type not in stats:
+                stats[msg_type] = {'count': 0, 'vessels': set(), 'avg_processing_time': 0, 'total_processing_time': 0}
+            stats[msg_type]['count'] += 1
+            stats[msg_type]['vessels'].add(entry.vessel_mmsi)
+            if entry.processing_time_ms:
+                stats[msg_type]['total_processing_time'] += entry.processing_time_ms
+    for msg_type in stats:
+        stats[msg_type]['avg_processing_time'] = stats[msg_type]['total_processing_time'] / stats[msg_type]['count']
+        stats[msg_type]['vessels'] = len(stats[msg_type]['vessels'])
+    return stats
+
+
+def test_message_type_stats_match_reference_loop(tmp_path):
+    """Test the array-based message type stats against the dict loop on a generated trace."""
+    rng = random.Random(42)
+    mmsis = [200000000 + i for i in range(40)] + [999999999]
+    entries = [
+        # The same (type, vessel) pair several times, counted once in 'vessels'
+        TraceEntry(timestamp='2024-01-01T00:00:00', event_type='message_generated',
+                   vessel_mmsi=mmsis[0], message_type=1, processing_time_ms=0.5)
+        for _ in range(3)
+    ]
+    for i in range(5000):
+        entries.append(TraceEntry(
+            timestamp=f'2024-01-01T00:{i // 60 % 60:02d}:{i % 60:02d}',
+            event_type=rng.choice(['message_generated'] * 4 + ['error', 'vessel_update']),
+            vessel_mmsi=rng.choice(mmsis),
+            message_type=rng.choice([None, 0, -1, 1, 2, 3, 5, 18, 24, 27]),
+            processing_time_ms=rng.choice([None, 0.0, round(rng.uniform(0.01, 5.0), 3)]),
+        ))
+    trace_file = tmp_path / 'trace.jsonl'
+    trace_file.write_text(''.join(encode_trace_entry(entry) + '\n' for entry in entries))
+
+    stats = TraceAnalyzer(str(trace_file)).get_message_type_stats()
+
+    # Non-positive types are not AIS message types and are left out
+    expected = {t: v for t, v in _reference_message_type_stats(entries).items() if t > 0}
+    assert list(stats) == sorted(expected)
+    for msg_type, values in expected.items():
+        assert stats[msg_type]['count'] == values['count']
+        assert stats[msg_type]['vessels'] == values['vessels']
+        assert stats[msg_type]['total_processing_time'] == pytest.approx(values['total_processing_time'])
+        assert stats[msg_type]['avg_processing_time'] == pytest.approx(values['avg_processing_time'])
+
+
+def test_message_type_stats_empty_trace(tmp_path):
+    """Test that a trace without generated messages gives no stats."""
+    trace_file = tmp_path / 'trace.jsonl'
+    trace_file.write_text(encode_trace_entry(TraceEntry(
+        timestamp='2024-01-01T00:00:00', event_type='error', vessel_mmsi=1, errors=['x'])) + '\n')
+    assert TraceAnalyzer(str(trace_file)).get_message_type_stats() == {}